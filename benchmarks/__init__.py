@@ -0,0 +1,11 @@
+r"""Performance benchmarks, run with pytest-benchmark.
+
+Save a baseline, then compare a later run against the latest saved one,
+failing if any benchmark's mean has slowed by more than 20%:
+
+    python -m pytest benchmarks --benchmark-autosave
+    python -m pytest benchmarks --benchmark-compare \
+        --benchmark-compare-fail=mean:20%
+
+Results are saved as JSON under .benchmarks/.
+"""
@@ -0,0 +1,77 @@
+from pytrek.engine import (
+    COURSE_VECTORS,
+    dump_snapshot,
+    FireTorpedo,
+    get_ray,
+    Navigate,
+    Snapshot,
+)
+
+from .scenarios import make_engine
+
+_ROUNDS = 200
+
+
+def _clear_course(engine):
+    local_map = engine.local_map
+    for course in COURSE_VECTORS:
+        ray = get_ray(
+            local_map.size,
+            engine.enterprise.sector_coordinates,
+            course,
+        )
+        if ray.first_hit(local_map.occupancy) is None:
+            return course
+    return 6
+
+
+def bench_klingon_moves(benchmark):
+    engine = make_engine()
+    benchmark(engine._process_klingon_moves)
+
+
+def bench_klingon_firing(benchmark):
+    def setup():
+        engine = make_engine()
+        engine._events = []
+        return (engine,), {}
+
+    benchmark.pedantic(
+        lambda engine: engine._process_klingon_firing(),
+        setup=setup,
+        rounds=_ROUNDS,
+    )
+
+
+def bench_warp_to_next_quadrant(benchmark):
+    def setup():
+        engine = make_engine()
+        return (engine, Navigate(_clear_course(engine), 1.0)), {}
+
+    benchmark.pedantic(
+        lambda engine, command: engine.execute(command),
+        setup=setup,
+        rounds=_ROUNDS,
+    )
+
+
+def bench_torpedo(benchmark):
+    def setup():
+        engine = make_engine()
+        return (engine, FireTorpedo(_clear_course(engine))), {}
+
+    benchmark.pedantic(
+        lambda engine, command: engine.execute(command),
+        setup=setup,
+        rounds=_ROUNDS,
+    )
+
+
+def bench_dump_snapshot(benchmark):
+    engine = make_engine()
+    benchmark(dump_snapshot, engine)
+
+
+def bench_restore_snapshot(benchmark):
+    snapshot = Snapshot(dump_snapshot(make_engine()))
+    benchmark(snapshot.restore)
@@ -0,0 +1,17 @@
+from pytrek.galaxies import Galaxy, LocalMap
+
+from .scenarios import make_engine
+
+
+def bench_galaxy(benchmark):
+    benchmark(Galaxy, seed=0)
+
+
+def bench_large_galaxy(benchmark):
+    benchmark(Galaxy, size=64, seed=0)
+
+
+def bench_local_map(benchmark):
+    engine = make_engine()
+    quadrant = engine.local_map.quadrant
+    benchmark(LocalMap, quadrant, engine.enterprise.sector_coordinates)
@@ -0,0 +1,17 @@
+from pytrek.simulate import play_mission
+
+
+def bench_hunter_mission(benchmark):
+    seeds = iter(range(1_000_000))
+    benchmark.pedantic(
+        lambda: play_mission(next(seeds), 'hunter'),
+        rounds=50,
+    )
+
+
+def bench_random_mission(benchmark):
+    seeds = iter(range(1_000_000))
+    benchmark.pedantic(
+        lambda: play_mission(next(seeds), 'random'),
+        rounds=50,
+    )
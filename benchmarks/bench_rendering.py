@@ -0,0 +1,43 @@
+import io
+
+from contextlib import redirect_stdout
+
+from pytrek.engine import LongRangeScan, ShortRangeScan
+
+from xenterprise import Enterprise
+
+from .scenarios import make_engine
+
+
+def bench_short_range_scan(benchmark):
+    engine = make_engine()
+    benchmark(engine.execute, ShortRangeScan())
+
+
+def bench_long_range_scan(benchmark):
+    engine = make_engine()
+    benchmark(engine.execute, LongRangeScan())
+
+
+def bench_local_map_draw(benchmark, window):
+    engine = make_engine()
+    benchmark(
+        engine.local_map.draw,
+        window,
+        engine.enterprise.sector_coordinates,
+    )
+
+
+def bench_text_short_range_scan(benchmark):
+    engine = make_engine()
+    event = engine.execute(ShortRangeScan())[0]
+    output = io.StringIO()
+    with redirect_stdout(output):
+        front_end = Enterprise(engine.galaxy)
+
+    def render():
+        output.seek(0)
+        with redirect_stdout(output):
+            front_end._render_event(event)
+
+    benchmark(render)
@@ -0,0 +1,17 @@
+import curses
+
+import pytest
+
+from .fake_curses import FakeWindow
+
+
+@pytest.fixture(autouse=True)
+def _fake_color_pairs(monkeypatch: pytest.MonkeyPatch):
+    # curses.color_pair() requires an initialised terminal:
+    monkeypatch.setattr(curses, 'color_pair', lambda pair: pair << 8)
+
+
+@pytest.fixture
+def window():
+    """A window the size of the short-range sensor display."""
+    return FakeWindow(8, 31)
@@ -0,0 +1,52 @@
+class FakeWindow:
+    """A stand-in for curses.window that records nothing and draws nothing.
+
+    Only the methods used by pytrek are provided. Writes are checked
+    against the window's bounds, as curses would check them.
+    """
+
+    def __init__(self, height: int, width: int, top: int = 0, left: int = 0):
+        self._size = (height, width)
+        self._position = (top, left)
+        self.writes = 0
+
+    def getmaxyx(self):
+        return self._size
+
+    def getbegyx(self):
+        return self._position
+
+    def _check(self, y: int, x: int):
+        height, width = self._size
+        if not (0 <= y < height and 0 <= x < width):
+            raise ValueError(f'Write outside the window at {y}, {x}')
+        self.writes += 1
+
+    def addstr(self, *args):
+        if len(args) >= 3:
+            self._check(args[0], args[1])
+
+    def addnstr(self, *args):
+        if len(args) >= 4:
+            self._check(args[0], args[1])
+
+    def chgat(self, y: int, x: int, *args):
+        self._check(y, x)
+
+    def erase(self):
+        pass
+
+    def box(self):
+        pass
+
+    def touchwin(self):
+        pass
+
+    def noutrefresh(self):
+        pass
+
+    def resize(self, height: int, width: int):
+        self._size = (height, width)
+
+    def mvwin(self, top: int, left: int):
+        self._position = (top, left)
@@ -0,0 +1,38 @@
+from pytrek.engine import Engine
+from pytrek.enterprise import Enterprise
+from pytrek.galaxies import Galaxy
+from pytrek.rng import RandomStreams
+
+
+def make_engine(seed: int = 0, klingons: int = 3, galaxy_size: int = 8):
+    """Returns a started engine with the Enterprise among Klingons.
+
+    The ship is placed mid-quadrant, in the quadrant with the requested
+    number of Klingons nearest the centre of the galaxy, so that it can
+    warp out in any direction.
+    """
+    streams = RandomStreams(seed)
+    galaxy = Galaxy(size=galaxy_size, seed=seed)
+    centre = galaxy.size // 2
+    candidates = sorted(
+        [
+            coordinates
+            for coordinates in galaxy.quadrants
+            if galaxy.quadrants[coordinates].klingons == klingons
+        ],
+        key=lambda x: abs(x[0] - centre) + abs(x[1] - centre),
+    )
+    enterprise = Enterprise(
+        galaxy.size,
+        galaxy.quadrant_size,
+        streams.generation,
+    )
+    if candidates:
+        enterprise.quadrant_coordinates = candidates[0]
+    enterprise.sector_coordinates = (
+        galaxy.quadrant_size // 2,
+        galaxy.quadrant_size // 2,
+    )
+    engine = Engine(galaxy, enterprise, streams)
+    engine.start()
+    return engine
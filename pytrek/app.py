@@ -1,16 +1,27 @@
 import curses
 
+from math import ceil
+from time import perf_counter, time
+from typing import TYPE_CHECKING
+
 from .color_pairs import ColorPair
-from .enterprise import Enterprise
-from .galaxies import Galaxy, LocalMap
-from .settings import settings
+from .metrics import LoopMetrics
+from .settings import get_settings
 from .states import State
 from .windows.base import AbstractFocusableWindow
 from .windows.border_boxes import BorderBox
+from .windows.compositor import Compositor
 from .windows.layout import LayoutMetric, LayoutValueComponent
+from .windows.performance_hud import PerformanceHud
 from .windows.sensors.short_range import ShortRangeDisplay
 from .windows.title_screen import TitleScreen
 
+if TYPE_CHECKING:
+    from .engine import Engine
+
+# Milliseconds without a further resize event before the layout is redone:
+_RESIZE_SETTLE_TIME = 50
+
 
 class ManagedWindow(AbstractFocusableWindow):
     def _draw_content(self):
@@ -20,9 +31,7 @@ class ManagedWindow(AbstractFocusableWindow):
 class App:
     def __init__(self, stdscr: curses.window):
         self.stdscr = stdscr
-        self._galaxy: Galaxy | None = None
-        self._enterprise = Enterprise()
-        self._local_map: LocalMap | None = None
+        self._engine: 'Engine | None' = None
         short_range_sensors_border_box = BorderBox(
             parent=stdscr,
             height=[
@@ -88,7 +97,6 @@ class App:
                 LayoutValueComponent(100, LayoutMetric.PERCENTAGE),
                 LayoutValueComponent(-2, LayoutMetric.CHARACTERS),
             ],
-            enterprise=self._enterprise,
         )
         self._game_windows = (
             short_range_sensors_border_box,
@@ -105,21 +113,86 @@ class App:
         )
         self._windows = [self.title_screen]
         self._focused_window = self.title_screen
+        self._compositor = Compositor()
+        self._metrics = LoopMetrics(get_settings().metrics_path)
+        self._hud = PerformanceHud(
+            parent=stdscr,
+            metrics=self._metrics,
+            left=[
+                LayoutValueComponent(100, LayoutMetric.PERCENTAGE),
+                LayoutValueComponent(-34, LayoutMetric.CHARACTERS),
+            ],
+            height=[
+                LayoutValueComponent(16, LayoutMetric.CHARACTERS),
+            ],
+            width=[
+                LayoutValueComponent(34, LayoutMetric.CHARACTERS),
+            ],
+        )
+        self._hud_visible = False
+
+    def _visible_windows(self):
+        if self._hud_visible:
+            return [*self._windows, self._hud]
+        return self._windows
+
+    def _draw_counts(self):
+        windows = (self.title_screen, *self._game_windows, self._hud)
+        return {
+            f'{type(window).__name__}#{i}': window.draw_count
+            for i, window in enumerate(windows)
+        }
+
+    def _toggle_hud(self):
+        self._hud_visible = not self._hud_visible
+        # Repaint everything, to restore whatever the overlay covered:
+        self.stdscr.clear()
+        self.stdscr.noutrefresh()
+        for window in self._visible_windows():
+            window.request_draw()
+
+    def _get_key(self) -> int:
+        """Blocks until a key is pressed or the next redraw is due."""
+        deadlines = [
+            deadline
+            for window in self._visible_windows()
+            if (deadline := window.next_deadline()) is not None
+        ]
+        if deadlines:
+            delay = max(0.0, min(deadlines) - time())
+            self.stdscr.timeout(ceil(delay * 1000))
+        else:
+            self.stdscr.timeout(-1)
+        start = perf_counter()
+        key = self.stdscr.getch()
+        self._metrics.record_key_wait(perf_counter() - start)
+        return key
+
+    def _await_resize_end(self):
+        """Consumes resize events until the terminal stops changing size."""
+        self.stdscr.timeout(_RESIZE_SETTLE_TIME)
+        while True:
+            key = self.stdscr.getch()
+            if key == curses.ERR:
+                return
+            elif key != curses.KEY_RESIZE:
+                curses.ungetch(key)
+                return
 
     def _loop_iteration(self, state: State):
         assert state != State.TERMINATE
-        for window in self._windows:
-            window.draw()
+        start = perf_counter()
+        if self._compositor.draw(self._visible_windows()):
+            self._metrics.record_frame(perf_counter() - start)
         match state:
             case State.STANDARD:
-                key = self.stdscr.getch()
+                key = self._get_key()
                 match key:
+                    case curses.ERR:  # Timed out waiting for a key.
+                        return State.STANDARD
                     case curses.KEY_F1:
-                        raise Exception([x.debug_draw_count for x in self._windows])
-                    case curses.KEY_F2:
-                        raise Exception([x.window.getmaxyx() for x in self._windows])
-                    case curses.KEY_F3:
-                        raise Exception([x._parent_window.getmaxyx() for x in self._windows])
+                        self._toggle_hud()
+                        return State.STANDARD
                     case curses.KEY_RESIZE:
                         return State.RESIZE
                     case 27:  # Esc
@@ -127,34 +200,40 @@ class App:
                     case _:
                         return self._focused_window.handle_key(key)
             case State.RESIZE:
+                self._await_resize_end()
+                # Clear the screen as part of the next frame's update:
                 self.stdscr.clear()
-                self.stdscr.refresh()
-                if self._local_map is not None:
-                    assert self._enterprise is not None
-                    self._local_map.draw(
-                        self._short_range_display.window,
-                        self._enterprise.sector_coordinates,
-                    )
-                for window in self._windows:
+                self.stdscr.noutrefresh()
+                # Hidden windows are placed too, ready to be shown:
+                start = perf_counter()
+                for window in (
+                    self.title_screen,
+                    *self._game_windows,
+                    self._hud,
+                ):
                     window.place()
+                self._metrics.record_layout(perf_counter() - start)
             case State.CREATE_GALAXY:
-                self._enterprise = Enterprise()
-                self._galaxy = Galaxy()
-                quadrant_map = self._galaxy.quadrants
-                initial_quadrant = self._enterprise.quadrant_coordinates
-                initial_sector = self._enterprise.sector_coordinates
-                self._local_map = LocalMap(
-                    quadrant=quadrant_map[initial_quadrant],
-                    player_sector_coordinates=initial_sector,
+                # The engine is imported here, while the title screen
+                # animates, to keep it out of the startup time:
+                from .engine import Engine
+                from .galaxies import Galaxy
+                from .rng import RandomStreams
+                settings = get_settings()
+                streams = RandomStreams()
+                galaxy = Galaxy(
+                    size=settings.galaxy_size,
+                    quadrant_size=settings.quadrant_size,
+                    seed=streams.seed,
+                    map_cache_size=settings.local_map_cache_size,
                 )
-                self.title_screen.set_orders(self._galaxy.orders)
+                self._engine = Engine(galaxy, streams=streams)
+                self._engine.start()
+                self.title_screen.set_orders(self._engine.galaxy.orders)
             case State.ENTER_GALAXY:
-                if self._local_map is not None:
-                    assert self._enterprise is not None
+                if self._engine is not None:
                     self._windows = self._game_windows
-                    self._short_range_display.set_local_map(
-                        self._local_map,
-                    )
+                    self._short_range_display.set_engine(self._engine)
             case _:
                 pass
         return State.STANDARD
@@ -183,13 +262,16 @@ class App:
             background_color,
         )
         self.stdscr.keypad(True)
-        self.stdscr.nodelay(True)
         self.stdscr.clear()
         self.stdscr.refresh()
         for window in self._windows:
             window.place()
-        while state != State.TERMINATE:
-            try:
-                state = self._loop_iteration(state)
-            except KeyboardInterrupt:
-                state = State.TERMINATE
+        try:
+            while state != State.TERMINATE:
+                try:
+                    state = self._loop_iteration(state)
+                except KeyboardInterrupt:
+                    state = State.TERMINATE
+                self._metrics.end_iteration(self._draw_counts())
+        finally:
+            self._metrics.close()
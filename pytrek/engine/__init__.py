@@ -0,0 +1,34 @@
+from .commands import (
+    AdjustShields as AdjustShields,
+    CalculateNavigation as CalculateNavigation,
+    Command as Command,
+    ComputerFunction as ComputerFunction,
+    DamageControl as DamageControl,
+    DEVICE_COMMANDS as DEVICE_COMMANDS,
+    FirePhasers as FirePhasers,
+    FireTorpedo as FireTorpedo,
+    LibraryComputer as LibraryComputer,
+    LongRangeScan as LongRangeScan,
+    Navigate as Navigate,
+    Resign as Resign,
+    ShortRangeScan as ShortRangeScan,
+)
+from .engine import (
+    calculate_navigation as calculate_navigation,
+    Engine as Engine,
+    MissionStatus as MissionStatus,
+)
+from .journal import (
+    Journal as Journal,
+    Replay as Replay,
+)
+from .rays import (
+    COURSE_VECTORS as COURSE_VECTORS,
+    get_ray as get_ray,
+    Ray as Ray,
+)
+from .snapshots import (
+    dump_snapshot as dump_snapshot,
+    save_snapshot as save_snapshot,
+    Snapshot as Snapshot,
+)
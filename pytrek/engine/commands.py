@@ -0,0 +1,91 @@
+from dataclasses import dataclass
+from enum import IntEnum
+
+
+class ComputerFunction(IntEnum):
+    GALACTIC_RECORD = 0
+    STATUS_REPORT = 1
+    TORPEDO_DATA = 2
+    STARBASE_NAV_DATA = 3
+    DIRECTION_CALCULATOR = 4
+    GALAXY_MAP = 5
+    CANCEL = 6
+
+
+# Parameters left as None are requested from the player by a Prompt event.
+
+@dataclass(frozen=True)
+class Navigate:
+    course: int | None = None
+    warp_factor: float | None = None
+
+
+@dataclass(frozen=True)
+class ShortRangeScan:
+    pass
+
+
+@dataclass(frozen=True)
+class LongRangeScan:
+    pass
+
+
+@dataclass(frozen=True)
+class FirePhasers:
+    units: int | None = None
+
+
+@dataclass(frozen=True)
+class FireTorpedo:
+    course: int | None = None
+
+
+@dataclass(frozen=True)
+class AdjustShields:
+    units: int | None = None
+
+
+@dataclass(frozen=True)
+class DamageControl:
+    authorize_repair: bool | None = None
+
+
+@dataclass(frozen=True)
+class LibraryComputer:
+    function: ComputerFunction | None = None
+
+
+@dataclass(frozen=True)
+class CalculateNavigation:
+    start: tuple[int, int]
+    end: tuple[int, int]
+
+
+@dataclass(frozen=True)
+class Resign:
+    pass
+
+
+type Command = (
+    Navigate
+    | ShortRangeScan
+    | LongRangeScan
+    | FirePhasers
+    | FireTorpedo
+    | AdjustShields
+    | DamageControl
+    | LibraryComputer
+    | CalculateNavigation
+    | Resign
+)
+
+DEVICE_COMMANDS: dict[str, type[Command]] = {
+    'NAV': Navigate,
+    'SRS': ShortRangeScan,
+    'LRS': LongRangeScan,
+    'PHA': FirePhasers,
+    'TOR': FireTorpedo,
+    'SHE': AdjustShields,
+    'DAM': DamageControl,
+    'COM': LibraryComputer,
+}
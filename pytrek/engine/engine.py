@@ -0,0 +1,709 @@
+from enum import auto, Enum
+from math import ceil, floor, sqrt
+from typing import TYPE_CHECKING
+
+from ..enterprise import Enterprise
+from ..galaxies import Galaxy
+from ..rng import RandomStreams
+from .commands import (
+    AdjustShields,
+    CalculateNavigation,
+    Command,
+    ComputerFunction,
+    DamageControl,
+    FirePhasers,
+    FireTorpedo,
+    LibraryComputer,
+    LongRangeScan,
+    Navigate,
+    Resign,
+    ShortRangeScan,
+)
+from .events import (
+    ComputerFunctionRequested,
+    CoordinatesRequested,
+    CourseRequested,
+    DeviceDamaged,
+    DeviceImproved,
+    DeviceInoperative,
+    DevicesRepaired,
+    DeviceStatusReport,
+    Docked,
+    EnterpriseDestroyed,
+    EnterpriseHit,
+    Event,
+    GalacticRecord,
+    GalaxyMap,
+    InsufficientManeuveringEnergy,
+    InsufficientTorpedoEnergy,
+    InvalidCourse,
+    KlingonDestroyed,
+    KlingonHit,
+    KlingonsOpenFire,
+    KlingonUndamaged,
+    LongRangeScanned,
+    NavigationBlocked,
+    NavigationData,
+    NoEnemyShips,
+    OrderNotUnderstood,
+    PerimeterDenied,
+    PhaserUnitsRequested,
+    Prompt,
+    QuadrantEntered,
+    RepairAuthorizationRequested,
+    Resigned,
+    ShieldsAdjusted,
+    ShieldsDown,
+    ShieldsSupplyManeuver,
+    ShieldsUnchanged,
+    ShieldUnitsRequested,
+    ShortRangeScanned,
+    Stranded,
+    StarbaseDestroyed,
+    StarbaseNavData,
+    StatusReport,
+    TorpedoAbsorbed,
+    TorpedoData,
+    TorpedoesExpended,
+    TorpedoMissed,
+    TorpedoTrack,
+    WarpEnginesDamaged,
+    WarpFactorRejected,
+    WarpFactorRequested,
+)
+from .rays import COURSE_VECTORS, get_ray
+
+if TYPE_CHECKING:
+    from .journal import Journal
+
+
+class MissionStatus(Enum):
+    ACTIVE = auto()
+    DESTROYED = auto()
+    RESIGNED = auto()
+    RELIEVED = auto()
+    OUT_OF_TIME = auto()
+    VICTORY = auto()
+
+
+def _distance(start: tuple[int, int], end: tuple[int, int]):
+    return sqrt(pow(end[0] - start[0], 2) + pow(end[1] - start[1], 2))
+
+
+def calculate_navigation(start: tuple[int, int], end: tuple[int, int]):
+    """Returns the closest course and the distance between two positions."""
+    vertical_movement = end[0] - start[0]
+    horizontal_movement = end[1] - start[1]
+    if vertical_movement == 0:
+        if horizontal_movement > 0:
+            direction = 6
+        elif horizontal_movement < 0:
+            direction = 4
+        else:
+            direction = 5
+    elif horizontal_movement == 0:
+        if vertical_movement > 0:
+            direction = 2
+        else:
+            direction = 8
+    else:
+        slope = abs(vertical_movement) / abs(horizontal_movement)
+        if slope <= 0.5:
+            direction = 6 if horizontal_movement > 0 else 4
+        elif slope > 4.0:
+            direction = 2 if vertical_movement > 0 else 8
+        elif horizontal_movement > 0:
+            direction = 3 if vertical_movement > 0 else 9
+        else:
+            direction = 1 if vertical_movement > 0 else 7
+    return NavigationData(direction, _distance(start, end))
+
+
+class Engine:
+    """Applies the game rules to commands, reporting results as events.
+
+    The engine performs no I/O. Front ends translate player input into
+    commands, render the returned events, and answer any trailing Prompt
+    event by executing the command again with the missing parameter.
+
+    All randomness is drawn from the engine's streams, so a game created
+    from a given RandomStreams seed, and sent the same commands, always
+    plays out identically.
+    """
+
+    def __init__(
+            self,
+            galaxy: Galaxy | None = None,
+            enterprise: Enterprise | None = None,
+            streams: RandomStreams | None = None,
+    ):
+        if streams is None:
+            streams = RandomStreams()
+        if galaxy is None:
+            galaxy = Galaxy(seed=streams.seed)
+        if enterprise is None:
+            enterprise = Enterprise(
+                galaxy.size,
+                galaxy.quadrant_size,
+                streams.generation,
+            )
+        self.streams = streams
+        self.galaxy = galaxy
+        self.enterprise = enterprise
+        self.destroyed = False
+        self.resigned = False
+        self.relieved = False
+        # Records each executed command, if set:
+        self.journal: 'Journal | None' = None
+        self._events: list[Event] = []
+        self.local_map = self._generate_local_map()
+
+    @property
+    def status(self):
+        if self.destroyed:
+            return MissionStatus.DESTROYED
+        elif self.resigned:
+            return MissionStatus.RESIGNED
+        elif self.relieved:
+            return MissionStatus.RELIEVED
+        elif self.galaxy.klingon_count == 0:
+            return MissionStatus.VICTORY
+        elif self.galaxy.current_date >= self.galaxy.end_date:
+            return MissionStatus.OUT_OF_TIME
+        return MissionStatus.ACTIVE
+
+    @property
+    def efficiency(self):
+        elapsed = self.galaxy.current_date - self.galaxy.start_date
+        if elapsed <= 0:
+            return 0.0
+        return 1000.0 * pow(self.galaxy.initial_klingon_count / elapsed, 2)
+
+    def start(self) -> list[Event]:
+        """Returns the events describing the start of the mission."""
+        self._events = []
+        self._report_quadrant_entry()
+        self._docking_check()
+        return self._events
+
+    def execute(self, command: Command) -> list[Event]:
+        """Executes a single command, returning the resulting events."""
+        if self.journal is not None:
+            self.journal.append(command)
+        self._events = []
+        match command:
+            case Navigate():
+                self._navigate(command)
+            case ShortRangeScan():
+                self._short_range_scan()
+            case LongRangeScan():
+                self._long_range_scan()
+            case FirePhasers():
+                self._fire_phasers(command)
+            case FireTorpedo():
+                self._fire_torpedo(command)
+            case AdjustShields():
+                self._adjust_shields(command)
+            case DamageControl():
+                self._damage_control(command)
+            case LibraryComputer():
+                self._use_library_computer(command)
+            case CalculateNavigation():
+                self._calculate_navigation(command)
+            case Resign():
+                self.resigned = True
+                self._emit(Resigned())
+                return self._events
+        if not self._events or not isinstance(self._events[-1], Prompt):
+            self._stranded_check()
+            self._docking_check()
+        return self._events
+
+    def _emit(self, event: Event):
+        self._events.append(event)
+
+    def _device_operational(self, key: str):
+        return self.enterprise.devices[key].operational
+
+    def _generate_local_map(self):
+        coordinates = self.enterprise.quadrant_coordinates
+        self.galaxy.quadrants[coordinates].entered = True
+        return self.galaxy.local_maps.get(
+            coordinates,
+            self.enterprise.sector_coordinates,
+            self.streams.generation,
+        )
+
+    def _report_quadrant_entry(self):
+        quadrant = self.local_map.quadrant
+        self._emit(QuadrantEntered(
+            name=quadrant.name,
+            mission_start=self.galaxy.current_date == self.galaxy.start_date,
+            klingons=quadrant.klingons,
+            shields_low=self.enterprise.shields <= 200,
+        ))
+        self._short_range_scan()
+
+    def _docking_check(self):
+        enterprise = self.enterprise
+        enterprise.docked = False
+        x, y = enterprise.sector_coordinates
+        for starbase_x, starbase_y in self.local_map.starbases:
+            if abs(starbase_x - x) <= 1 and abs(starbase_y - y) <= 1:
+                enterprise.docked = True
+                enterprise.energy = enterprise.MAX_ENERGY
+                enterprise.shields = 0
+                enterprise.torpedoes = enterprise.MAX_TORPEDOES
+                self._emit(Docked())
+                return
+
+    def _stranded_check(self):
+        if self.destroyed or self.relieved:
+            return
+        elif self.enterprise.energy > 10:
+            return
+        elif self.enterprise.total_energy > 10:
+            if self._device_operational('SHE'):
+                return
+        self.destroyed = True
+        self._emit(Stranded())
+
+    def _destroy_klingon(self, sector: tuple[int, int]):
+        self.local_map.remove_klingon(sector)
+        self.local_map.quadrant.klingons -= 1
+        self._emit(KlingonDestroyed(sector))
+
+    def _process_klingon_moves(self):
+        # Live Klingons move to random empty sectors:
+        local_map = self.local_map
+        for position in list(local_map.klingons.keys()):
+            klingon = local_map.remove_klingon(position)
+            if klingon.strength <= 0.0:
+                continue
+            new_position = local_map.get_random_empty_sector(
+                self.enterprise.sector_coordinates,
+                self.streams.combat,
+            )
+            local_map.add_klingon(new_position, klingon)
+
+    def _process_klingon_firing(self):
+        if not self.local_map.klingons:
+            return
+        self._emit(KlingonsOpenFire(self.enterprise.docked))
+        if self.enterprise.docked:
+            return
+        devices = self.enterprise.devices
+        rng = self.streams.combat
+        for position, klingon in self.local_map.klingons.items():
+            distance = _distance(self.enterprise.sector_coordinates, position)
+            damage = int(
+                (klingon.strength / distance) * (2.0 + rng.random()),
+            )
+            klingon.strength /= 3.0 + rng.random()
+            self._emit(EnterpriseHit(damage, position))
+            if damage >= self.enterprise.shields:
+                self.destroyed = True
+                self._emit(EnterpriseDestroyed())
+                return
+            self.enterprise.shields -= damage
+            self._emit(ShieldsDown(self.enterprise.shields))
+            ratio = damage / self.enterprise.shields
+            if rng.random() > 0.4 and ratio > 0.02:
+                key = rng.choice(list(devices.keys()))
+                devices[key].health -= ratio + 0.5 * rng.random()
+                self._emit(DeviceDamaged(key, by_hit=True))
+
+    def _process_repairs(self, warp_factor: float):
+        devices = self.enterprise.devices
+        repair = min(1.0, warp_factor)
+        repaired = []
+        for key, device in devices.items():
+            if device.operational:
+                continue
+            device.health += repair
+            if device.operational:
+                repaired.append(key)
+        if repaired:
+            self._emit(DevicesRepaired(tuple(repaired)))
+        rng = self.streams.combat
+        if rng.random() >= 0.2:
+            return
+        key = rng.choice(list(devices.keys()))
+        if rng.random() >= 0.6:
+            devices[key].health += rng.random() * 3.0 + 1.0
+            self._emit(DeviceImproved(key))
+        else:
+            devices[key].health -= rng.random() * 0.5 + 1.0
+            self._emit(DeviceDamaged(key, by_hit=False))
+
+    def _consume_maneuver_energy(self, cost: int):
+        enterprise = self.enterprise
+        enterprise.energy -= cost + 10
+        if enterprise.energy < 0:
+            self._emit(ShieldsSupplyManeuver())
+            enterprise.shields = max(enterprise.shields + enterprise.energy, 0)
+            enterprise.energy = 0
+
+    def _navigate(self, command: Navigate):
+        enterprise = self.enterprise
+        if command.course is None:
+            self._emit(CourseRequested('NAV'))
+            return
+        direction_vector = COURSE_VECTORS.get(command.course)
+        if direction_vector is None:
+            self._emit(InvalidCourse('NAV'))
+            return
+        device_operational = self._device_operational('NAV')
+        max_factor = 8.0 if device_operational else 0.2
+        if command.warp_factor is None:
+            self._emit(WarpFactorRequested(command.course, max_factor))
+            return
+        factor = round(command.warp_factor, 1)
+        if factor == 0.0:
+            return
+        elif factor > max_factor and not device_operational:
+            self._emit(WarpEnginesDamaged())
+            return
+        elif not 0.0 < factor <= max_factor:
+            self._emit(WarpFactorRejected(factor))
+            return
+        cost = int(factor * 8.0 + 0.5)
+        if cost > enterprise.energy:
+            self._emit(InsufficientManeuveringEnergy(
+                warp_factor=factor,
+                shields=enterprise.shields,
+                shields_available=(
+                    self._device_operational('SHE')
+                    and enterprise.total_energy >= cost
+                ),
+            ))
+            return
+        # Klingons respond to movement:
+        self._process_klingon_moves()
+        self._process_klingon_firing()
+        if self.destroyed:
+            return
+        self._process_repairs(factor)
+        # Warp 1 crosses the width of a quadrant:
+        galaxy_size = self.galaxy.size
+        quadrant_size = self.galaxy.quadrant_size
+        steps = int(factor * quadrant_size + 0.5)
+        initial_position = [
+            enterprise.quadrant_coordinates[i] * quadrant_size
+            + enterprise.sector_coordinates[i]
+            for i in range(2)
+        ]
+        # The ship travels along its ray until it meets an object or the
+        # edge of the quadrant:
+        ray = get_ray(
+            quadrant_size,
+            enterprise.sector_coordinates,
+            command.course,
+        )
+        hit = ray.first_hit(self.local_map.occupancy)
+        blocked = hit is not None and hit < steps
+        path = ray.sectors[:hit if blocked else steps]
+        if path:
+            enterprise.sector_coordinates = path[-1]
+        new_quadrant = False
+        out_of_bounds = False
+        if blocked:
+            self._emit(NavigationBlocked(enterprise.sector_coordinates))
+        elif steps > len(ray.sectors):
+            # The first axis to leave the quadrant decides whether the ship
+            # crosses into the next quadrant or meets the perimeter:
+            x, y = enterprise.sector_coordinates
+            if not 0 <= x + direction_vector[0] < quadrant_size:
+                i = 0
+            else:
+                i = 1
+            destination = (
+                enterprise.quadrant_coordinates[i] + direction_vector[i]
+            )
+            if 0 <= destination < galaxy_size:
+                new_quadrant = True
+            else:
+                out_of_bounds = True
+                if i == 1:
+                    # The step along the first axis is still taken:
+                    sector = (x + direction_vector[0], y)
+                    if self.local_map.is_occupied(sector):
+                        self._emit(NavigationBlocked((x, y)))
+                    else:
+                        enterprise.sector_coordinates = sector
+        if new_quadrant:
+            self.galaxy.current_date += 1
+            self._consume_maneuver_energy(cost)
+            limit = galaxy_size * quadrant_size - 1
+            final_position = [
+                max(0, min(position + movement * steps, limit))
+                for position, movement in zip(
+                    initial_position,
+                    direction_vector,
+                )
+            ]
+            enterprise.quadrant_coordinates = tuple([
+                x // quadrant_size for x in final_position
+            ])
+            enterprise.sector_coordinates = tuple([
+                x % quadrant_size for x in final_position
+            ])
+            self.local_map = self._generate_local_map()
+            self._report_quadrant_entry()
+        elif out_of_bounds:
+            self.galaxy.current_date += 1
+            self._consume_maneuver_energy(cost)
+            self._emit(PerimeterDenied(
+                quadrant=enterprise.quadrant_coordinates,
+                sector=enterprise.sector_coordinates,
+            ))
+        else:
+            self.galaxy.current_date += min(0.1 * int(factor * 10.0), 1.0)
+            self._consume_maneuver_energy(cost)
+
+    def _short_range_scan(self):
+        if not self._device_operational('SRS'):
+            self._emit(DeviceInoperative('SRS'))
+            return
+        enterprise = self.enterprise
+        if self.local_map.klingons:
+            condition = 'RED'
+        elif enterprise.energy < 0.1 * enterprise.MAX_ENERGY:
+            condition = 'YELLOW'
+        else:
+            condition = 'GREEN'
+        self._emit(ShortRangeScanned(
+            size=self.local_map.size,
+            stardate=floor(self.galaxy.current_date),
+            condition=condition,
+            quadrant=enterprise.quadrant_coordinates,
+            sector=enterprise.sector_coordinates,
+            torpedoes=enterprise.torpedoes,
+            total_energy=enterprise.total_energy,
+            shields=enterprise.shields,
+            klingons_remaining=self.galaxy.klingon_count,
+            klingons=frozenset(self.local_map.klingons.keys()),
+            starbases=frozenset(self.local_map.starbases),
+            stars=frozenset(self.local_map.stars),
+            rows=self.local_map.render_rows(enterprise.sector_coordinates),
+        ))
+
+    def _long_range_scan(self):
+        if not self._device_operational('LRS'):
+            self._emit(DeviceInoperative('LRS'))
+            return
+        size = self.galaxy.size
+        q1, q2 = self.enterprise.quadrant_coordinates
+        rows = []
+        for x in range(q1 - 1, q1 + 2):
+            row = []
+            for y in range(q2 - 1, q2 + 2):
+                if 0 <= x < size and 0 <= y < size:
+                    quadrant = self.galaxy.quadrants[(x, y)]
+                    row.append((
+                        quadrant.klingons,
+                        int(quadrant.has_starbase),
+                        quadrant.stars,
+                    ))
+                else:
+                    row.append(None)
+            rows.append(tuple(row))
+        self._emit(LongRangeScanned((q1, q2), tuple(rows)))
+
+    def _fire_phasers(self, command: FirePhasers):
+        enterprise = self.enterprise
+        if not self._device_operational('PHA'):
+            self._emit(DeviceInoperative('PHA'))
+            return
+        elif not self.local_map.klingons:
+            self._emit(NoEnemyShips())
+            return
+        computer_operational = self._device_operational('COM')
+        if command.units is None:
+            self._emit(PhaserUnitsRequested(
+                energy=enterprise.energy,
+                computer_damaged=not computer_operational,
+            ))
+            return
+        elif not 0 < command.units <= enterprise.energy:
+            return
+        enterprise.energy -= command.units
+        rng = self.streams.combat
+        value = float(command.units)
+        if not computer_operational:
+            value *= rng.random()
+        base_damage = value / len(self.local_map.klingons)
+        for position in list(self.local_map.klingons.keys()):
+            klingon = self.local_map.klingons[position]
+            distance = _distance(enterprise.sector_coordinates, position)
+            damage = (base_damage / distance) * (rng.random() + 2.0)
+            if damage <= 0.15 * klingon.strength:
+                self._emit(KlingonUndamaged(position))
+                continue
+            klingon.strength -= damage
+            self._emit(KlingonHit(damage, position, klingon.strength))
+            if klingon.strength <= 0.0:
+                self._destroy_klingon(position)
+        self._process_klingon_firing()
+
+    def _fire_torpedo(self, command: FireTorpedo):
+        enterprise = self.enterprise
+        if not self._device_operational('TOR'):
+            self._emit(DeviceInoperative('TOR'))
+            return
+        elif enterprise.torpedoes <= 0:
+            self._emit(TorpedoesExpended())
+            return
+        elif enterprise.energy < 2:
+            self._emit(InsufficientTorpedoEnergy())
+            return
+        elif command.course is None:
+            self._emit(CourseRequested('TOR'))
+            return
+        elif command.course not in COURSE_VECTORS:
+            self._emit(InvalidCourse('TOR'))
+            return
+        enterprise.energy -= 2
+        enterprise.torpedoes -= 1
+        ray = get_ray(
+            self.local_map.size,
+            enterprise.sector_coordinates,
+            command.course,
+        )
+        hit = ray.first_hit(self.local_map.occupancy)
+        if hit is None:
+            self._emit(TorpedoTrack(ray.sectors))
+            self._emit(TorpedoMissed())
+            self._process_klingon_firing()
+            return
+        self._emit(TorpedoTrack(ray.sectors[:hit + 1]))
+        sector = ray.sectors[hit]
+        if sector in self.local_map.klingons:
+            self._destroy_klingon(sector)
+        elif sector in self.local_map.stars:
+            self._emit(TorpedoAbsorbed(sector))
+        elif sector in self.local_map.starbases:
+            self.local_map.remove_starbase(sector)
+            self.local_map.quadrant.has_starbase = False
+            galaxy = self.galaxy
+            self.relieved = galaxy.klingon_count > galaxy.time_remaining
+            self._emit(StarbaseDestroyed(sector, self.relieved))
+            if self.relieved:
+                return
+        self._process_klingon_firing()
+
+    def _adjust_shields(self, command: AdjustShields):
+        enterprise = self.enterprise
+        if not self._device_operational('SHE'):
+            self._emit(DeviceInoperative('SHE'))
+            return
+        total_energy = enterprise.total_energy
+        if command.units is None:
+            self._emit(ShieldUnitsRequested(total_energy))
+        elif command.units < 0:
+            self._emit(OrderNotUnderstood('SHE'))
+        elif command.units > total_energy:
+            self._emit(ShieldsUnchanged(excessive=True))
+        elif command.units == enterprise.shields:
+            self._emit(ShieldsUnchanged(excessive=False))
+        else:
+            enterprise.shields = command.units
+            enterprise.energy = total_energy - enterprise.shields
+            self._emit(ShieldsAdjusted(enterprise.shields))
+
+    def _report_device_status(self):
+        self._emit(DeviceStatusReport(tuple([
+            (key, device.health)
+            for key, device in self.enterprise.devices.items()
+        ])))
+
+    def _damage_control(self, command: DamageControl):
+        enterprise = self.enterprise
+        if command.authorize_repair is None:
+            if not self._device_operational('DAM'):
+                self._emit(DeviceInoperative('DAM'))
+            else:
+                self._report_device_status()
+        if not enterprise.docked:
+            return
+        repair_time = self.local_map.repair_factor * sum([
+            0.1 if not device.operational else 0.0
+            for device in enterprise.devices.values()
+        ])
+        if repair_time == 0.0:
+            return
+        match command.authorize_repair:
+            case None:
+                self._emit(RepairAuthorizationRequested(repair_time))
+            case True:
+                for device in enterprise.devices.values():
+                    device.health = max(device.health, 0.0)
+                self._report_device_status()
+
+    def _use_library_computer(self, command: LibraryComputer):
+        if not self._device_operational('COM'):
+            self._emit(DeviceInoperative('COM'))
+            return
+        match command.function:
+            case None:
+                self._emit(ComputerFunctionRequested())
+            case ComputerFunction.GALACTIC_RECORD:
+                # Read straight from the tables, so that no quadrant views
+                # are created for the whole galaxy:
+                galaxy = self.galaxy
+                size = galaxy.size
+                records = [
+                    (klingons, starbase, stars) if entered else None
+                    for klingons, starbase, stars, entered in zip(
+                        galaxy.klingon_table,
+                        galaxy.starbase_table,
+                        galaxy.star_table,
+                        galaxy.entered_table,
+                    )
+                ]
+                self._emit(GalacticRecord(
+                    quadrant=self.enterprise.quadrant_coordinates,
+                    rows=tuple([
+                        tuple(records[i * size:(i + 1) * size])
+                        for i in range(size)
+                    ]),
+                ))
+            case ComputerFunction.STATUS_REPORT:
+                self._emit(StatusReport(
+                    klingons=self.galaxy.klingon_count,
+                    time_remaining=ceil(self.galaxy.time_remaining),
+                    starbases=self.galaxy.starbase_count,
+                ))
+                self._damage_control(DamageControl())
+            case ComputerFunction.TORPEDO_DATA:
+                self._emit(TorpedoData(tuple([
+                    calculate_navigation(
+                        self.enterprise.sector_coordinates,
+                        position,
+                    )
+                    for position in self.local_map.klingons.keys()
+                ])))
+            case ComputerFunction.STARBASE_NAV_DATA:
+                target = None
+                for position in self.local_map.starbases:
+                    target = calculate_navigation(
+                        self.enterprise.sector_coordinates,
+                        position,
+                    )
+                    break
+                self._emit(StarbaseNavData(target))
+            case ComputerFunction.DIRECTION_CALCULATOR:
+                self._emit(CoordinatesRequested(
+                    quadrant=self.enterprise.quadrant_coordinates,
+                    sector=self.enterprise.sector_coordinates,
+                ))
+            case ComputerFunction.GALAXY_MAP:
+                self._emit(GalaxyMap(self.galaxy.names.region_map))
+            case _:
+                pass
+
+    def _calculate_navigation(self, command: CalculateNavigation):
+        if not self._device_operational('COM'):
+            self._emit(DeviceInoperative('COM'))
+            return
+        self._emit(calculate_navigation(command.start, command.end))
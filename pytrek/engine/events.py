@@ -0,0 +1,298 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class Event:
+    pass
+
+
+@dataclass(frozen=True)
+class Prompt(Event):
+    """An event requesting a missing command parameter from the player."""
+
+
+# Prompts:
+
+@dataclass(frozen=True)
+class CourseRequested(Prompt):
+    device: str
+
+
+@dataclass(frozen=True)
+class WarpFactorRequested(Prompt):
+    course: int
+    max_factor: float
+
+
+@dataclass(frozen=True)
+class PhaserUnitsRequested(Prompt):
+    energy: int
+    computer_damaged: bool
+
+
+@dataclass(frozen=True)
+class ShieldUnitsRequested(Prompt):
+    total_energy: int
+
+
+@dataclass(frozen=True)
+class RepairAuthorizationRequested(Prompt):
+    repair_time: float
+
+
+@dataclass(frozen=True)
+class ComputerFunctionRequested(Prompt):
+    pass
+
+
+@dataclass(frozen=True)
+class CoordinatesRequested(Prompt):
+    quadrant: tuple[int, int]
+    sector: tuple[int, int]
+
+
+# Ship status:
+
+@dataclass(frozen=True)
+class Docked(Event):
+    pass
+
+
+@dataclass(frozen=True)
+class Stranded(Event):
+    pass
+
+
+@dataclass(frozen=True)
+class EnterpriseDestroyed(Event):
+    pass
+
+
+@dataclass(frozen=True)
+class Resigned(Event):
+    pass
+
+
+@dataclass(frozen=True)
+class DeviceInoperative(Event):
+    device: str
+
+
+@dataclass(frozen=True)
+class OrderNotUnderstood(Event):
+    device: str
+
+
+@dataclass(frozen=True)
+class InvalidCourse(Event):
+    device: str
+
+
+# Navigation:
+
+@dataclass(frozen=True)
+class QuadrantEntered(Event):
+    name: str
+    mission_start: bool
+    klingons: int
+    shields_low: bool
+
+
+@dataclass(frozen=True)
+class WarpEnginesDamaged(Event):
+    pass
+
+
+@dataclass(frozen=True)
+class WarpFactorRejected(Event):
+    warp_factor: float
+
+
+@dataclass(frozen=True)
+class InsufficientManeuveringEnergy(Event):
+    warp_factor: float
+    shields: int
+    shields_available: bool
+
+
+@dataclass(frozen=True)
+class NavigationBlocked(Event):
+    sector: tuple[int, int]
+
+
+@dataclass(frozen=True)
+class ShieldsSupplyManeuver(Event):
+    pass
+
+
+@dataclass(frozen=True)
+class PerimeterDenied(Event):
+    quadrant: tuple[int, int]
+    sector: tuple[int, int]
+
+
+# Damage control:
+
+@dataclass(frozen=True)
+class DevicesRepaired(Event):
+    devices: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class DeviceImproved(Event):
+    device: str
+
+
+@dataclass(frozen=True)
+class DeviceDamaged(Event):
+    device: str
+    by_hit: bool
+
+
+@dataclass(frozen=True)
+class DeviceStatusReport(Event):
+    devices: tuple[tuple[str, float], ...]
+
+
+# Sensors:
+
+@dataclass(frozen=True)
+class ShortRangeScanned(Event):
+    size: int
+    stardate: int
+    condition: str
+    quadrant: tuple[int, int]
+    sector: tuple[int, int]
+    torpedoes: int
+    total_energy: int
+    shields: int
+    klingons_remaining: int
+    klingons: frozenset[tuple[int, int]]
+    starbases: frozenset[tuple[int, int]]
+    stars: frozenset[tuple[int, int]]
+    rows: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class LongRangeScanned(Event):
+    quadrant: tuple[int, int]
+    rows: tuple[tuple[tuple[int, int, int] | None, ...], ...]
+
+
+# Combat:
+
+@dataclass(frozen=True)
+class NoEnemyShips(Event):
+    pass
+
+
+@dataclass(frozen=True)
+class KlingonsOpenFire(Event):
+    docked: bool
+
+
+@dataclass(frozen=True)
+class EnterpriseHit(Event):
+    damage: int
+    sector: tuple[int, int]
+
+
+@dataclass(frozen=True)
+class ShieldsDown(Event):
+    shields: int
+
+
+@dataclass(frozen=True)
+class KlingonUndamaged(Event):
+    sector: tuple[int, int]
+
+
+@dataclass(frozen=True)
+class KlingonHit(Event):
+    damage: float
+    sector: tuple[int, int]
+    remaining: float
+
+
+@dataclass(frozen=True)
+class KlingonDestroyed(Event):
+    sector: tuple[int, int]
+
+
+@dataclass(frozen=True)
+class TorpedoesExpended(Event):
+    pass
+
+
+@dataclass(frozen=True)
+class InsufficientTorpedoEnergy(Event):
+    pass
+
+
+@dataclass(frozen=True)
+class TorpedoTrack(Event):
+    sectors: tuple[tuple[int, int], ...]
+
+
+@dataclass(frozen=True)
+class TorpedoMissed(Event):
+    pass
+
+
+@dataclass(frozen=True)
+class TorpedoAbsorbed(Event):
+    sector: tuple[int, int]
+
+
+@dataclass(frozen=True)
+class StarbaseDestroyed(Event):
+    sector: tuple[int, int]
+    relieved: bool
+
+
+# Shields:
+
+@dataclass(frozen=True)
+class ShieldsUnchanged(Event):
+    excessive: bool
+
+
+@dataclass(frozen=True)
+class ShieldsAdjusted(Event):
+    shields: int
+
+
+# Library computer:
+
+@dataclass(frozen=True)
+class GalacticRecord(Event):
+    quadrant: tuple[int, int]
+    rows: tuple[tuple[tuple[int, int, int] | None, ...], ...]
+
+
+@dataclass(frozen=True)
+class StatusReport(Event):
+    klingons: int
+    time_remaining: int
+    starbases: int
+
+
+@dataclass(frozen=True)
+class NavigationData(Event):
+    direction: int
+    distance: float
+
+
+@dataclass(frozen=True)
+class TorpedoData(Event):
+    targets: tuple[NavigationData, ...]
+
+
+@dataclass(frozen=True)
+class StarbaseNavData(Event):
+    target: NavigationData | None
+
+
+@dataclass(frozen=True)
+class GalaxyMap(Event):
+    regions: tuple[tuple[str, ...], ...]
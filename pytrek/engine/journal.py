@@ -0,0 +1,185 @@
+import json
+
+from dataclasses import fields
+from typing import TextIO
+
+from ..galaxies import Galaxy
+from ..rng import RandomStreams
+from .commands import (
+    AdjustShields,
+    CalculateNavigation,
+    Command,
+    ComputerFunction,
+    DamageControl,
+    FirePhasers,
+    FireTorpedo,
+    LibraryComputer,
+    LongRangeScan,
+    Navigate,
+    Resign,
+    ShortRangeScan,
+)
+from .engine import Engine
+from .events import Event
+from .snapshots import dump_snapshot, Snapshot
+
+_VERSION = 1
+
+_COMMAND_TYPES: dict[str, type[Command]] = {
+    command_type.__name__: command_type
+    for command_type in (
+        Navigate,
+        ShortRangeScan,
+        LongRangeScan,
+        FirePhasers,
+        FireTorpedo,
+        AdjustShields,
+        DamageControl,
+        LibraryComputer,
+        CalculateNavigation,
+        Resign,
+    )
+}
+
+
+def _encode_command(command: Command):
+    return [type(command).__name__] + [
+        getattr(command, field.name) for field in fields(command)
+    ]
+
+
+def _decode_command(values: list) -> Command:
+    name, *parameters = values
+    parameters = [
+        tuple(x) if isinstance(x, list) else x for x in parameters
+    ]
+    if name == LibraryComputer.__name__ and parameters[0] is not None:
+        parameters[0] = ComputerFunction(parameters[0])
+    return _COMMAND_TYPES[name](*parameters)
+
+
+class Journal:
+    """The commands executed in a game, with the seeds that created it.
+
+    Every command is recorded, including incomplete ones answered by a
+    Prompt, so the journal holds the player's answers to each prompt. Only
+    games whose galaxy and Enterprise were generated from these seeds, as
+    Engine does by default, can be replayed.
+    """
+
+    def __init__(
+            self,
+            galaxy_seed: int,
+            streams_seed: int,
+            galaxy_size: int = 8,
+            quadrant_size: int = 8,
+            map_cache_size: int = 16,
+            commands: list[Command] | None = None,
+    ):
+        self.galaxy_seed = galaxy_seed
+        self.streams_seed = streams_seed
+        self.galaxy_size = galaxy_size
+        self.quadrant_size = quadrant_size
+        self.map_cache_size = map_cache_size
+        self.commands: list[Command] = [] if commands is None else commands
+
+    @classmethod
+    def attach(cls, engine: Engine):
+        """Starts recording the commands executed by a new engine."""
+        galaxy = engine.galaxy
+        journal = cls(
+            galaxy_seed=galaxy.seed,
+            streams_seed=engine.streams.seed,
+            galaxy_size=galaxy.size,
+            quadrant_size=galaxy.quadrant_size,
+            map_cache_size=galaxy.local_maps.capacity,
+        )
+        engine.journal = journal
+        return journal
+
+    def __len__(self):
+        return len(self.commands)
+
+    def append(self, command: Command):
+        self.commands.append(command)
+
+    def create_engine(self):
+        """Returns a started engine in the game's initial state."""
+        streams = RandomStreams(self.streams_seed)
+        galaxy = Galaxy(
+            size=self.galaxy_size,
+            quadrant_size=self.quadrant_size,
+            seed=self.galaxy_seed,
+            map_cache_size=self.map_cache_size,
+        )
+        engine = Engine(galaxy, streams=streams)
+        engine.start()
+        return engine
+
+    def dump(self, file: TextIO):
+        """Writes the journal as lines of JSON, one per command."""
+        file.write(json.dumps({
+            'version': _VERSION,
+            'galaxy_seed': self.galaxy_seed,
+            'streams_seed': self.streams_seed,
+            'galaxy_size': self.galaxy_size,
+            'quadrant_size': self.quadrant_size,
+            'map_cache_size': self.map_cache_size,
+        }) + '\n')
+        for command in self.commands:
+            file.write(json.dumps(_encode_command(command)) + '\n')
+
+    def save(self, path: str):
+        with open(path, 'w') as file:
+            self.dump(file)
+
+    @classmethod
+    def load(cls, path: str):
+        with open(path, 'r') as file:
+            header = json.loads(file.readline())
+            version = header.pop('version')
+            if version != _VERSION:
+                raise ValueError(f'Unsupported journal version {version}')
+            commands = [_decode_command(json.loads(line)) for line in file]
+        return cls(**header, commands=commands)
+
+
+class Replay:
+    """Re-runs a journal headlessly, discarding events unless stepping.
+
+    A snapshot is kept every snapshot_interval turns as the replay runs, so
+    that seeking back to a turn only re-executes the commands since the
+    nearest snapshot.
+    """
+
+    def __init__(self, journal: Journal, snapshot_interval: int = 100):
+        self.journal = journal
+        self.snapshot_interval = snapshot_interval
+        self.engine = journal.create_engine()
+        self.turn = 0
+        self._snapshots: list[bytes] = []
+
+    def step(self) -> list[Event]:
+        """Executes the next command, returning its events."""
+        if self.turn == len(self._snapshots) * self.snapshot_interval:
+            self._snapshots.append(dump_snapshot(self.engine))
+        events = self.engine.execute(self.journal.commands[self.turn])
+        self.turn += 1
+        return events
+
+    def run(self, until: int | None = None):
+        """Executes commands up to the given turn, or to the end."""
+        if until is None:
+            until = len(self.journal)
+        until = min(until, len(self.journal))
+        while self.turn < until:
+            self.step()
+        return self.engine
+
+    def seek(self, turn: int):
+        """Returns the engine as it was before the given turn's command."""
+        index = min(turn // self.snapshot_interval, len(self._snapshots) - 1)
+        if turn < self.turn:
+            self.engine = Snapshot(self._snapshots[index]).restore()
+            self.turn = index * self.snapshot_interval
+        return self.run(turn)
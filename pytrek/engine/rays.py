@@ -0,0 +1,66 @@
+from functools import lru_cache
+from typing import NamedTuple
+
+COURSE_VECTORS = {
+    1: (+1, -1),
+    2: (+1, +0),
+    3: (+1, +1),
+    4: (+0, -1),
+    6: (+0, +1),
+    7: (-1, -1),
+    8: (-1, +0),
+    9: (-1, +1),
+}
+
+# Enough for every ray of a standard 8x8 quadrant several times over:
+_RAY_CACHE_SIZE = 4096
+
+
+class Ray(NamedTuple):
+    """The sectors passed through from an origin to the quadrant's edge.
+
+    Sector indices are x * size + y, matching the LocalMap bitboards, so
+    the first object along the ray can be found from the occupancy mask
+    without stepping through the sectors.
+    """
+
+    origin: int
+    step: int
+    sectors: tuple[tuple[int, int], ...]
+    mask: int
+
+    def first_hit(self, occupancy: int) -> int | None:
+        """Returns the position along the ray of the first occupied sector."""
+        hits = occupancy & self.mask
+        if not hits:
+            return None
+        if self.step > 0:
+            index = (hits & -hits).bit_length() - 1
+        else:
+            index = hits.bit_length() - 1
+        return (index - self.origin) // self.step - 1
+
+
+@lru_cache(maxsize=_RAY_CACHE_SIZE)
+def get_ray(size: int, sector: tuple[int, int], course: int):
+    """Returns the ray from a sector along a course, in a size x size grid.
+
+    Rays are built on first use and the most recently used are cached, so
+    large quadrants only pay for the rays actually cast.
+    """
+    dx, dy = COURSE_VECTORS[course]
+    x, y = sector
+    sectors = []
+    mask = 0
+    while True:
+        x, y = x + dx, y + dy
+        if not (0 <= x < size and 0 <= y < size):
+            break
+        sectors.append((x, y))
+        mask |= 1 << (x * size + y)
+    return Ray(
+        sector[0] * size + sector[1],
+        dx * size + dy,
+        tuple(sectors),
+        mask,
+    )
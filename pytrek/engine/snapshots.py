@@ -0,0 +1,291 @@
+import mmap
+import struct
+
+from math import isnan, nan
+from random import Random
+
+from ..enterprise import Enterprise
+from ..galaxies import Galaxy, LocalMap
+from ..rng import RandomStreams
+from .engine import Engine
+
+_MAGIC = b'PTRK'
+_VERSION = 1
+
+# Mission-wide values, at the start of the file:
+_HEADER = struct.Struct('<4sH3H2Qd4i2qh4H4?2H')
+
+# The Mersenne Twister state and cached Gaussian value of each stream:
+_STREAM_STATE = struct.Struct('<625Id')
+
+# One record per quadrant, in galaxy table order: Klingons, starbase,
+# stars and whether the quadrant has been entered.
+_QUADRANT_RECORD_SIZE = 4
+
+# One record per device: its key and health.
+_DEVICE = struct.Struct('<3sd')
+
+# Each cached local map is a header followed by its Klingons, stars and
+# starbases:
+_LOCAL_MAP = struct.Struct('<5Hd')
+_KLINGON = struct.Struct('<2Hd')
+_SECTOR = struct.Struct('<2H')
+
+# Sizes, coordinates and counts are stored as unsigned 16-bit values:
+_MAX_SIZE = 0xFFFF
+
+
+def _stream_state(rng: Random):
+    _, state, gauss = rng.getstate()
+    return _STREAM_STATE.pack(*state, nan if gauss is None else gauss)
+
+
+def _set_stream_state(rng: Random, buffer: memoryview, offset: int):
+    *state, gauss = _STREAM_STATE.unpack_from(buffer, offset)
+    rng.setstate((3, tuple(state), None if isnan(gauss) else gauss))
+
+
+def dump_snapshot(engine: Engine) -> bytes:
+    """Returns a snapshot of the full state of a game."""
+    galaxy = engine.galaxy
+    enterprise = engine.enterprise
+    streams = engine.streams
+    local_maps = list(galaxy.local_maps)
+    for name, value in (
+            ('galaxy size', galaxy.size),
+            ('quadrant size', galaxy.quadrant_size),
+            ('map cache size', galaxy.local_maps.capacity),
+    ):
+        if not 0 <= value <= _MAX_SIZE:
+            raise ValueError(
+                f'Cannot snapshot a {name} of {value}; '
+                f'the largest is {_MAX_SIZE}'
+            )
+    parts = [
+        _HEADER.pack(
+            _MAGIC,
+            _VERSION,
+            galaxy.size,
+            galaxy.quadrant_size,
+            galaxy.local_maps.capacity,
+            galaxy.seed,
+            streams.seed,
+            galaxy.current_date,
+            galaxy.start_date,
+            galaxy.end_date,
+            galaxy.initial_klingon_count,
+            galaxy.initial_starbase_count,
+            enterprise.energy,
+            enterprise.shields,
+            enterprise.torpedoes,
+            *enterprise.quadrant_coordinates,
+            *enterprise.sector_coordinates,
+            enterprise.docked,
+            engine.destroyed,
+            engine.resigned,
+            engine.relieved,
+            len(enterprise.devices),
+            len(local_maps),
+        ),
+        _stream_state(streams.generation),
+        _stream_state(streams.combat),
+        _stream_state(streams.ai),
+    ]
+    quadrants = bytearray(_QUADRANT_RECORD_SIZE * galaxy.size * galaxy.size)
+    quadrants[0::4] = galaxy.klingon_table
+    quadrants[1::4] = galaxy.starbase_table
+    quadrants[2::4] = galaxy.star_table
+    quadrants[3::4] = galaxy.entered_table
+    parts.append(quadrants)
+    parts += [
+        _DEVICE.pack(key.encode('ascii'), device.health)
+        for key, device in enterprise.devices.items()
+    ]
+    for local_map in local_maps:
+        parts.append(_LOCAL_MAP.pack(
+            *local_map.quadrant.coordinates,
+            len(local_map.klingons),
+            len(local_map.stars),
+            len(local_map.starbases),
+            local_map.repair_factor,
+        ))
+        parts += [
+            _KLINGON.pack(*sector, klingon.strength)
+            for sector, klingon in local_map.klingons.items()
+        ]
+        parts += [_SECTOR.pack(*sector) for sector in local_map.stars]
+        parts += [_SECTOR.pack(*sector) for sector in local_map.starbases]
+    return b''.join(parts)
+
+
+def save_snapshot(engine: Engine, path: str):
+    """Writes a snapshot of the full state of a game to a file."""
+    with open(path, 'wb') as file:
+        file.write(dump_snapshot(engine))
+
+
+class Snapshot:
+    """A saved game, from which any number of engines can be restored.
+
+    Only the fixed-size header is read on creation. Snapshots opened from
+    a file are memory-mapped, so the remaining sections are read directly
+    from the page cache each time a game is restored.
+    """
+
+    def __init__(self, buffer: bytes | mmap.mmap):
+        self._buffer = buffer
+        self._view = memoryview(buffer)
+        if len(buffer) < _HEADER.size:
+            raise ValueError('Snapshot is truncated')
+        (
+            magic,
+            version,
+            self.galaxy_size,
+            self.quadrant_size,
+            self.map_cache_size,
+            self.galaxy_seed,
+            self.streams_seed,
+            self.current_date,
+            self.start_date,
+            self.end_date,
+            self.initial_klingon_count,
+            self.initial_starbase_count,
+            self.energy,
+            self.shields,
+            self.torpedoes,
+            quadrant_x,
+            quadrant_y,
+            sector_x,
+            sector_y,
+            self.docked,
+            self.destroyed,
+            self.resigned,
+            self.relieved,
+            self.device_count,
+            self.local_map_count,
+        ) = _HEADER.unpack_from(buffer)
+        if magic != _MAGIC:
+            raise ValueError('Not a snapshot')
+        if version != _VERSION:
+            raise ValueError(f'Unsupported snapshot version {version}')
+        self.quadrant_coordinates = (quadrant_x, quadrant_y)
+        self.sector_coordinates = (sector_x, sector_y)
+        self._streams_offset = _HEADER.size
+        self._quadrants_offset = self._streams_offset + 3 * _STREAM_STATE.size
+        self._devices_offset = (
+            self._quadrants_offset
+            + _QUADRANT_RECORD_SIZE * self.galaxy_size * self.galaxy_size
+        )
+        self._local_maps_offset = (
+            self._devices_offset + _DEVICE.size * self.device_count
+        )
+
+    @classmethod
+    def open(cls, path: str):
+        """Memory-maps a snapshot file."""
+        with open(path, 'rb') as file:
+            return cls(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def close(self):
+        self._view.release()
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _restore_galaxy(self):
+        start = self._quadrants_offset
+        quadrants = self._view[start:self._devices_offset]
+        # Stardates are whole until the first short warp:
+        current_date = self.current_date
+        if current_date.is_integer():
+            current_date = int(current_date)
+        return Galaxy.from_state(
+            size=self.galaxy_size,
+            quadrant_size=self.quadrant_size,
+            seed=self.galaxy_seed,
+            klingons=quadrants[0::4].tobytes(),
+            starbases=quadrants[1::4].tobytes(),
+            stars=quadrants[2::4].tobytes(),
+            entered=quadrants[3::4].tobytes(),
+            initial_klingon_count=self.initial_klingon_count,
+            initial_starbase_count=self.initial_starbase_count,
+            start_date=self.start_date,
+            current_date=current_date,
+            end_date=self.end_date,
+            map_cache_size=self.map_cache_size,
+        )
+
+    def _restore_local_maps(self, galaxy: Galaxy):
+        offset = self._local_maps_offset
+        for _ in range(self.local_map_count):
+            (
+                x,
+                y,
+                klingon_count,
+                star_count,
+                starbase_count,
+                repair_factor,
+            ) = _LOCAL_MAP.unpack_from(self._view, offset)
+            offset += _LOCAL_MAP.size
+            klingons = {}
+            for _ in range(klingon_count):
+                sector_x, sector_y, strength = _KLINGON.unpack_from(
+                    self._view,
+                    offset,
+                )
+                klingons[(sector_x, sector_y)] = LocalMap.Klingon(strength)
+                offset += _KLINGON.size
+            end = offset + _SECTOR.size * (star_count + starbase_count)
+            sectors = list(_SECTOR.iter_unpack(self._view[offset:end]))
+            offset = end
+            galaxy.local_maps.add(LocalMap.from_contents(
+                quadrant=galaxy.quadrants[(x, y)],
+                klingons=klingons,
+                stars=sectors[:star_count],
+                starbases=sectors[star_count:],
+                repair_factor=repair_factor,
+            ))
+
+    def _restore_enterprise(self):
+        devices = self._view[self._devices_offset:self._local_maps_offset]
+        return Enterprise.from_state(
+            energy=self.energy,
+            shields=self.shields,
+            torpedoes=self.torpedoes,
+            quadrant_coordinates=self.quadrant_coordinates,
+            sector_coordinates=self.sector_coordinates,
+            docked=self.docked,
+            device_health={
+                key.decode('ascii'): health
+                for key, health in _DEVICE.iter_unpack(devices)
+            },
+        )
+
+    def restore(self, streams: RandomStreams | None = None):
+        """Returns a new engine in the saved state.
+
+        By default the random streams continue from their saved states, so
+        every restored game plays out identically. Supply other streams to
+        branch the game from the snapshot instead.
+        """
+        saved_streams = streams is None
+        if saved_streams:
+            streams = RandomStreams(self.streams_seed)
+        galaxy = self._restore_galaxy()
+        self._restore_local_maps(galaxy)
+        enterprise = self._restore_enterprise()
+        engine = Engine(galaxy, enterprise, streams)
+        engine.destroyed = self.destroyed
+        engine.resigned = self.resigned
+        engine.relieved = self.relieved
+        if saved_streams:
+            offset = self._streams_offset
+            for rng in (streams.generation, streams.combat, streams.ai):
+                _set_stream_state(rng, self._view, offset)
+                offset += _STREAM_STATE.size
+        return engine
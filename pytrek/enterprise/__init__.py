@@ -1 +1,5 @@
-from .enterprise import Enterprise as Enterprise
\ No newline at end of file
+from .enterprise import (
+    Device as Device,
+    DEVICE_DETAILS as DEVICE_DETAILS,
+    Enterprise as Enterprise,
+)
@@ -1,13 +1,100 @@
-from random import randint
+from collections.abc import Mapping
+from dataclasses import dataclass
+from random import Random
+
+
+# Device names and help text, keyed by command, shared by every ship:
+DEVICE_DETAILS = {
+    'NAV': ('WARP ENGINES', 'TO SET COURSE'),
+    'SRS': ('SHORT RANGE SENSORS', 'FOR SHORT RANGE SENSOR SCAN'),
+    'LRS': ('LONG RANGE SENSORS', 'FOR LONG RANGE SENSOR SCAN'),
+    'PHA': ('PHASER CONTROL', 'TO FIRE PHASERS'),
+    'TOR': ('PHOTON TUBES', 'TO FIRE PHOTON TORPEDOES'),
+    'SHE': ('SHIELD CONTROL', 'TO RAISE OR LOWER SHIELDS'),
+    'DAM': ('DAMAGE CONTROL', 'FOR DAMAGE CONTROL REPORTS'),
+    'COM': ('LIBRARY-COMPUTER', 'TO CALL ON LIBRARY-COMPUTER'),
+}
+
+
+@dataclass(slots=True)
+class Device:
+    key: str
+    health: float = 0.0
+
+    @property
+    def name(self) -> str:
+        return DEVICE_DETAILS[self.key][0]
+
+    @property
+    def help_text(self) -> str:
+        return DEVICE_DETAILS[self.key][1]
+
+    @property
+    def operational(self):
+        return self.health >= 0.0
 
 
 class Enterprise:
     MAX_ENERGY = 3000
     MAX_TORPEDOES = 10
 
-    def __init__(self):
+    __slots__ = (
+        'energy',
+        'shields',
+        'torpedoes',
+        'quadrant_coordinates',
+        'sector_coordinates',
+        'docked',
+        'devices',
+    )
+
+    def __init__(
+            self,
+            galaxy_size: int = 8,
+            quadrant_size: int = 8,
+            rng: Random | None = None,
+    ):
+        if rng is None:
+            rng = Random()
         self.energy = self.MAX_ENERGY
         self.shields = 0
         self.torpedoes = self.MAX_TORPEDOES
-        self.quadrant_coordinates = (randint(0, 7), randint(0, 7))
-        self.sector_coordinates = (randint(0, 7), randint(0, 7))
+        self.quadrant_coordinates = (
+            rng.randint(0, galaxy_size - 1),
+            rng.randint(0, galaxy_size - 1),
+        )
+        self.sector_coordinates = (
+            rng.randint(0, quadrant_size - 1),
+            rng.randint(0, quadrant_size - 1),
+        )
+        self.docked = False
+        self.devices = {key: Device(key) for key in DEVICE_DETAILS}
+
+    @classmethod
+    def from_state(
+            cls,
+            energy: int,
+            shields: int,
+            torpedoes: int,
+            quadrant_coordinates: tuple[int, int],
+            sector_coordinates: tuple[int, int],
+            docked: bool,
+            device_health: Mapping[str, float],
+    ):
+        """Creates a ship in a saved state, such as from a snapshot."""
+        enterprise = cls.__new__(cls)
+        enterprise.energy = energy
+        enterprise.shields = shields
+        enterprise.torpedoes = torpedoes
+        enterprise.quadrant_coordinates = quadrant_coordinates
+        enterprise.sector_coordinates = sector_coordinates
+        enterprise.docked = docked
+        enterprise.devices = {
+            key: Device(key, device_health.get(key, 0.0))
+            for key in DEVICE_DETAILS
+        }
+        return enterprise
+
+    @property
+    def total_energy(self):
+        return self.energy + self.shields
@@ -1,2 +1,11 @@
-from .galaxies import Galaxy as Galaxy
-from .quadrants import LocalMap as LocalMap, Quadrant as Quadrant
+from .galaxies import (
+    Galaxy as Galaxy,
+    get_name_table as get_name_table,
+    get_region_name as get_region_name,
+    NameTable as NameTable,
+)
+from .quadrants import (
+    LocalMap as LocalMap,
+    LocalMapCache as LocalMapCache,
+    Quadrant as Quadrant,
+)
@@ -1,8 +1,14 @@
 import itertools
 
-from random import randint
+from array import array
+from collections.abc import Iterable, Mapping
+from functools import cache
+from random import Random
+from sys import intern
+from typing import NamedTuple
 
-from .quadrants import Quadrant
+from ..rng import normalise_seed
+from .quadrants import LocalMapCache, Quadrant
 
 _REGION_NAMES = [
     'ANTARES',
@@ -24,40 +30,284 @@ _REGION_NAMES = [
 ]
 
 
-def _get_quadrant_name(position: tuple[int, int]):
-    assert 0 <= position[0], position[1] < 8
-    region = _REGION_NAMES[position[0] + int(position[1] >= 4) * 8]
-    suffixes = ['I', 'II', 'III', 'IV']
-    return f'{region} {suffixes[position[1] % 4]}'
+def get_region_name(position: tuple[int, int]):
+    """Returns the name of the region containing a quadrant.
+
+    The sixteen classic regions tile the galaxy in 8x8 blocks; outside the
+    first block, region names are qualified with the block's coordinates.
+    """
+    x, y = position
+    region = _REGION_NAMES[x % 8 + (y // 4) % 2 * 8]
+    if x >= 8 or y >= 8:
+        region = f'{region} {x // 8 + 1}.{y // 8 + 1}'
+    return region
+
+
+_SUFFIXES = ('I', 'II', 'III', 'IV')
+
+
+class NameTable(NamedTuple):
+    """Interned region and quadrant names for one galaxy size.
+
+    Names are indexed like the galaxy's tables. The region map holds each
+    row's region names, as shown by the library computer.
+    """
+
+    regions: tuple[str, ...]
+    suffixes: tuple[str, ...]
+    quadrants: tuple[str, ...]
+    region_map: tuple[tuple[str, ...], ...]
+
+
+@cache
+def get_name_table(size: int):
+    """Returns the names for a size x size galaxy, shared by all of them."""
+    positions = list(itertools.product(range(size), repeat=2))
+    regions = tuple([intern(get_region_name(x)) for x in positions])
+    suffixes = tuple([_SUFFIXES[y % 4] for _, y in positions])
+    return NameTable(
+        regions=regions,
+        suffixes=suffixes,
+        quadrants=tuple([
+            intern(f'{region} {suffix}')
+            for region, suffix in zip(regions, suffixes)
+        ]),
+        region_map=tuple([
+            regions[x * size:(x + 1) * size:4] for x in range(size)
+        ]),
+    )
+
+
+def _roll_quadrants(rng: Random, count: int):
+    """Rolls the Klingon, starbase and star counts for each quadrant."""
+    random, randint = rng.random, rng.randint
+    for _ in range(count):
+        klingon_roll = random()
+        if klingon_roll > 0.98:
+            klingons = 3
+        elif klingon_roll > 0.95:
+            klingons = 2
+        elif klingon_roll > 0.80:
+            klingons = 1
+        else:
+            klingons = 0
+        stars = randint(1, 8)
+        has_starbase = random() > 0.96
+        yield klingons, has_starbase, stars
+
+
+class _QuadrantViews(Mapping[tuple[int, int], Quadrant]):
+    """Lazily created Quadrant views, keyed by quadrant coordinates."""
+
+    __slots__ = ('_galaxy', '_views')
+
+    def __init__(self, galaxy: 'Galaxy'):
+        self._galaxy = galaxy
+        self._views: dict[tuple[int, int], Quadrant] = {}
+
+    def __getitem__(self, coordinates: tuple[int, int]):
+        view = self._views.get(coordinates)
+        if view is None:
+            x, y = coordinates
+            size = self._galaxy.size
+            if not (0 <= x < size and 0 <= y < size):
+                raise KeyError(coordinates)
+            view = Quadrant(self._galaxy, (x, y))
+            self._views[coordinates] = view
+        return view
+
+    def __iter__(self):
+        return itertools.product(range(self._galaxy.size), repeat=2)
+
+    def __len__(self):
+        return self._galaxy.size * self._galaxy.size
 
 
 class Galaxy:
-    def __init__(self):
-        self.quadrants = {
-            (x, y): Quadrant(_get_quadrant_name((x, y)))
-            for x, y in itertools.product(range(8), repeat=2)
-        }
+    """The contents of all quadrants, stored as flat row-major tables.
+
+    The galaxy is size x size quadrants, each of which is a grid of
+    quadrant_size x quadrant_size sectors. Only quadrant counts are held;
+    sector layouts are generated on entry from per-quadrant seeds derived
+    from the galaxy seed, so a given seed always produces the same galaxy.
+    """
+
+    __slots__ = (
+        'size',
+        'quadrant_size',
+        'seed',
+        'names',
+        'klingon_table',
+        'starbase_table',
+        'star_table',
+        'entered_table',
+        'quadrants',
+        'local_maps',
+        '_klingon_count',
+        '_starbase_count',
+        'initial_klingon_count',
+        'initial_starbase_count',
+        'start_date',
+        'current_date',
+        'end_date',
+    )
+
+    def __init__(
+            self,
+            size: int = 8,
+            quadrant_size: int = 8,
+            klingons: Iterable[int] | None = None,
+            starbases: Iterable[bool] | None = None,
+            stars: Iterable[int] | None = None,
+            seed: int | None = None,
+            map_cache_size: int = 16,
+    ):
+        seed = normalise_seed(seed)
+        rng = Random(seed)
+        if klingons is None or starbases is None or stars is None:
+            klingons, starbases, stars = zip(
+                *_roll_quadrants(rng, size * size),
+            )
+        self._populate(
+            size,
+            quadrant_size,
+            seed,
+            klingons,
+            starbases,
+            stars,
+            bytes(size * size),
+            map_cache_size,
+        )
+        if self._starbase_count == 0:
+            insertion_position = (
+                rng.randint(0, size - 1),
+                rng.randint(0, size - 1),
+            )
+            index = self.index(insertion_position)
+            self.set_starbase(insertion_position, True)
+            if self.klingon_table[index] < 2:
+                self.set_klingons(
+                    insertion_position,
+                    self.klingon_table[index] + 1,
+                )
         self.initial_klingon_count = self.klingon_count
         self.initial_starbase_count = self.starbase_count
-        if self.initial_starbase_count == 0:
-            self.initial_starbase_count = 1
-            insertion_position = (randint(0, 7), randint(0, 7))
-            self.quadrants[insertion_position].has_starbase = True
-            if self.quadrants[insertion_position].klingons < 2:
-                self.quadrants[insertion_position].klingons += 1
-        duration = max(randint(0, 9) + 25, self.initial_klingon_count + 1)
-        self.start_date = randint(20, 39) * 100
+        duration = max(
+            rng.randint(0, 9) + 25,
+            self.initial_klingon_count + 1,
+        )
+        self.start_date = rng.randint(20, 39) * 100
         self.current_date = self.start_date
         self.end_date = self.start_date + duration
 
+    @classmethod
+    def from_state(
+            cls,
+            size: int,
+            quadrant_size: int,
+            seed: int,
+            klingons: Iterable[int],
+            starbases: Iterable[bool],
+            stars: Iterable[int],
+            entered: Iterable[bool],
+            initial_klingon_count: int,
+            initial_starbase_count: int,
+            start_date: int,
+            current_date: float,
+            end_date: int,
+            map_cache_size: int = 16,
+    ):
+        """Creates a galaxy in a saved state, such as from a snapshot.
+
+        Unlike a new galaxy, no starbase is inserted if there are none.
+        """
+        galaxy = cls.__new__(cls)
+        galaxy._populate(
+            size,
+            quadrant_size,
+            normalise_seed(seed),
+            klingons,
+            starbases,
+            stars,
+            entered,
+            map_cache_size,
+        )
+        galaxy.initial_klingon_count = initial_klingon_count
+        galaxy.initial_starbase_count = initial_starbase_count
+        galaxy.start_date = start_date
+        galaxy.current_date = current_date
+        galaxy.end_date = end_date
+        return galaxy
+
+    def _populate(
+            self,
+            size: int,
+            quadrant_size: int,
+            seed: int,
+            klingons: Iterable[int],
+            starbases: Iterable[bool],
+            stars: Iterable[int],
+            entered: Iterable[bool],
+            map_cache_size: int,
+    ):
+        self.size = size
+        self.quadrant_size = quadrant_size
+        self.seed = seed
+        self.names = get_name_table(size)
+        self.klingon_table = array('b', klingons)
+        self.starbase_table = array('b', starbases)
+        self.star_table = array('b', stars)
+        self.entered_table = array('b', entered)
+        self.quadrants = _QuadrantViews(self)
+        self.local_maps = LocalMapCache(self, map_cache_size)
+        self._klingon_count = sum(self.klingon_table)
+        self._starbase_count = sum(self.starbase_table)
+
+    @classmethod
+    def from_tables(
+            cls,
+            klingons: list[list[int]],
+            starbases: list[list[bool]],
+            stars: list[list[int]],
+            seed: int | None = None,
+    ):
+        """Creates a galaxy from square tables of quadrant contents."""
+        return cls(
+            size=len(klingons),
+            klingons=itertools.chain.from_iterable(klingons),
+            starbases=itertools.chain.from_iterable(starbases),
+            stars=itertools.chain.from_iterable(stars),
+            seed=seed,
+        )
+
     @property
     def klingon_count(self):
-        return sum([x.klingons for x in self.quadrants.values()])
+        return self._klingon_count
 
     @property
     def starbase_count(self):
-        return sum([int(x.has_starbase) for x in self.quadrants.values()])
-    
+        return self._starbase_count
+
+    def index(self, coordinates: tuple[int, int]):
+        """Returns the position of a quadrant's entries in the tables."""
+        return coordinates[0] * self.size + coordinates[1]
+
+    def quadrant_seed(self, coordinates: tuple[int, int]):
+        """Returns the seed from which a quadrant's layout is generated."""
+        return (self.seed << 32) + self.index(coordinates)
+
+    def set_klingons(self, coordinates: tuple[int, int], value: int):
+        """Sets a quadrant's Klingon count, keeping the total up to date."""
+        index = self.index(coordinates)
+        self._klingon_count += value - self.klingon_table[index]
+        self.klingon_table[index] = value
+
+    def set_starbase(self, coordinates: tuple[int, int], value: bool):
+        """Sets whether a quadrant has a starbase, keeping the total."""
+        index = self.index(coordinates)
+        self._starbase_count += int(value) - self.starbase_table[index]
+        self.starbase_table[index] = value
+
     @property
     def time_remaining(self):
         return self.end_date - self.current_date
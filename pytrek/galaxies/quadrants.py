@@ -1,95 +1,352 @@
 import curses
-import itertools
 
+from collections import OrderedDict
+from collections.abc import Iterable
 from dataclasses import dataclass
-from random import randint, random, sample
+from random import Random
+from typing import TYPE_CHECKING
 
 from ..color_pairs import ColorPair
 
+if TYPE_CHECKING:
+    from .galaxies import Galaxy
+
+# Each sector is drawn as four characters, the first being a separator:
+_EMPTY_CELL = b'    '
+_PLAYER_CELL = ' <*>'
+_KLINGON_CELL = b' +K+'
+_STAR_CELL = b'  * '
+_STARBASE_CELL = b' >!<'
+
 
 class LocalMap:
-    @dataclass
+    @dataclass(slots=True)
     class Klingon:
         strength: float
 
+    __slots__ = (
+        'quadrant',
+        'size',
+        'klingons',
+        'stars',
+        'starbases',
+        'klingon_mask',
+        'star_mask',
+        'starbase_mask',
+        'occupancy',
+        '_rows',
+        'repair_factor',
+    )
+
     def __init__(
             self,
             quadrant: 'Quadrant',
             player_sector_coordinates: tuple[int, int],
     ):
-        self.quadrant = quadrant
-        available_positions = [
-            (x, y)
-            for x, y in itertools.product(range(8), repeat=2)
-            if (x, y) != player_sector_coordinates
-        ]
+        size = quadrant.galaxy.quadrant_size
+        rng = Random(quadrant.seed)
         required_space = quadrant.klingons + quadrant.stars
         if quadrant.has_starbase:
             required_space += 1
-        choices = sample(available_positions, required_space)
+        # Sample one spare sector, which replaces the player's sector if it
+        # was chosen, so the layout does not depend on the entry position:
+        indices = rng.sample(range(size * size), required_space + 1)
+        player_index = (
+            player_sector_coordinates[0] * size
+            + player_sector_coordinates[1]
+        )
+        spare = indices.pop()
+        if player_index in indices:
+            indices[indices.index(player_index)] = spare
+        choices = [divmod(index, size) for index in indices]
 
         klingon_positions, star_positions, starbase_positions = (
             choices[0:quadrant.klingons],
             choices[quadrant.klingons:quadrant.klingons + quadrant.stars],
             choices[quadrant.klingons + quadrant.stars:],
         )
-        self.klingons = {
-            position: self.Klingon(200.0 * (0.5 + random()))
+        klingons = {
+            position: self.Klingon(200.0 * (0.5 + rng.random()))
             for position in klingon_positions
         }
-        self.stars = set([x for x in star_positions])
-        self.starbases = set([x for x in starbase_positions])
+        self._populate(
+            quadrant,
+            klingons,
+            star_positions,
+            starbase_positions,
+            0.5 * rng.random(),
+        )
+
+    @classmethod
+    def from_contents(
+            cls,
+            quadrant: 'Quadrant',
+            klingons: dict[tuple[int, int], Klingon],
+            stars: Iterable[tuple[int, int]],
+            starbases: Iterable[tuple[int, int]],
+            repair_factor: float,
+    ):
+        """Creates a map with known contents, such as from a snapshot."""
+        local_map = cls.__new__(cls)
+        local_map._populate(
+            quadrant,
+            klingons,
+            stars,
+            starbases,
+            repair_factor,
+        )
+        return local_map
 
-        self.repair_factor = 0.5 * random()
+    def _populate(
+            self,
+            quadrant: 'Quadrant',
+            klingons: dict[tuple[int, int], Klingon],
+            stars: Iterable[tuple[int, int]],
+            starbases: Iterable[tuple[int, int]],
+            repair_factor: float,
+    ):
+        self.quadrant = quadrant
+        self.size = quadrant.galaxy.quadrant_size
+        self.klingons = klingons
+        self.stars = set(stars)
+        self.starbases = set(starbases)
+
+        # Bitboards, with bit x * size + y set for each occupied sector. The
+        # collections above must be changed through the methods below so
+        # that the masks stay in step with them.
+        self.klingon_mask = self._mask(self.klingons)
+        self.star_mask = self._mask(self.stars)
+        self.starbase_mask = self._mask(self.starbases)
+        self.occupancy = (
+            self.klingon_mask | self.star_mask | self.starbase_mask
+        )
+
+        # Rendered rows of sector cells, likewise kept in step:
+        self._rows = [
+            bytearray(_EMPTY_CELL * self.size) for _ in range(self.size)
+        ]
+        for sector in self.klingons:
+            self._set_cell(sector, _KLINGON_CELL)
+        for sector in self.stars:
+            self._set_cell(sector, _STAR_CELL)
+        for sector in self.starbases:
+            self._set_cell(sector, _STARBASE_CELL)
+
+        self.repair_factor = repair_factor
+
+    def _bit(self, sector: tuple[int, int]):
+        return 1 << (sector[0] * self.size + sector[1])
+
+    def _set_cell(self, sector: tuple[int, int], cell: bytes):
+        x, y = sector
+        self._rows[x][y * 4:y * 4 + 4] = cell
+
+    def _mask(self, sectors: Iterable[tuple[int, int]]):
+        mask = 0
+        for sector in sectors:
+            mask |= self._bit(sector)
+        return mask
+
+    def is_occupied(self, sector: tuple[int, int]):
+        return bool(self.occupancy & self._bit(sector))
+
+    def get_empty_sectors(self, player_sector_coordinates: tuple[int, int]):
+        empty = ~(self.occupancy | self._bit(player_sector_coordinates))
+        return [
+            divmod(index, self.size)
+            for index in range(self.size * self.size)
+            if empty >> index & 1
+        ]
+
+    def get_random_empty_sector(
+            self,
+            player_sector_coordinates: tuple[int, int],
+            rng: Random,
+    ):
+        """Picks an empty sector uniformly without scanning the grid."""
+        # At most 13 of the 16 or more sectors are occupied, so rejection
+        # sampling needs few attempts, and usually only one.
+        blocked = self.occupancy | self._bit(player_sector_coordinates)
+        while True:
+            index = rng.randrange(self.size * self.size)
+            if not blocked >> index & 1:
+                return divmod(index, self.size)
+
+    def add_klingon(self, sector: tuple[int, int], klingon: Klingon):
+        """Places a Klingon in an empty sector."""
+        self.klingons[sector] = klingon
+        bit = self._bit(sector)
+        self.klingon_mask |= bit
+        self.occupancy |= bit
+        self._set_cell(sector, _KLINGON_CELL)
+
+    def remove_klingon(self, sector: tuple[int, int]):
+        """Removes a Klingon from the map, returning it."""
+        bit = self._bit(sector)
+        self.klingon_mask &= ~bit
+        self.occupancy &= ~bit
+        self._set_cell(sector, _EMPTY_CELL)
+        return self.klingons.pop(sector)
+
+    def remove_starbase(self, sector: tuple[int, int]):
+        """Removes a starbase from the map."""
+        self.starbases.remove(sector)
+        bit = self._bit(sector)
+        self.starbase_mask &= ~bit
+        self.occupancy &= ~bit
+        self._set_cell(sector, _EMPTY_CELL)
+
+    def vacate(self, sector: tuple[int, int], rng: Random):
+        """Moves any object in a sector to a random empty sector."""
+        if not self.is_occupied(sector):
+            return
+        destination = self.get_random_empty_sector(sector, rng)
+        if sector in self.klingons:
+            self.add_klingon(destination, self.remove_klingon(sector))
+            return
+        move = self._bit(sector) | self._bit(destination)
+        if sector in self.stars:
+            self.stars.remove(sector)
+            self.stars.add(destination)
+            self.star_mask ^= move
+            self._set_cell(destination, _STAR_CELL)
+        else:
+            self.starbases.remove(sector)
+            self.starbases.add(destination)
+            self.starbase_mask ^= move
+            self._set_cell(destination, _STARBASE_CELL)
+        self.occupancy ^= move
+        self._set_cell(sector, _EMPTY_CELL)
+
+    def render_rows(self, player_sector_coordinates: tuple[int, int]):
+        """Returns the map as text rows, four characters per sector."""
+        rows = [row.decode('ascii') for row in self._rows]
+        x, y = player_sector_coordinates
+        rows[x] = rows[x][:y * 4] + _PLAYER_CELL + rows[x][y * 4 + 4:]
+        return tuple(rows)
 
     def draw(self, window: curses.window, player_position: tuple[int, int]):
         """Draws the map to the supplied window, given sufficient space."""
         height, width = window.getmaxyx()
-        if height < 8 or width < 31:
+        required_height, required_width = self.size, self.size * 4 - 1
+        if height < required_height or width < required_width:
             if height > 1 and width > 1:
                 window.addstr('Insufficient space!'[:width - 1])
             return
-        empty_space = (height - 8, width - 31)
-        window.addstr(
-            player_position[0] + empty_space[0] // 2,
-            player_position[1] * 3 + empty_space[1] // 2,
-            '<*>',
-        )
-        for klingon_position in self.klingons.keys():
-            window.addstr(
-                klingon_position[0] + empty_space[0] // 2,
-                klingon_position[1] * 3 + empty_space[1] // 2,
-                '+K+',
-                curses.color_pair(ColorPair.KLINGON),
-            )
-        for star_position in self.stars:
-            window.addstr(
-                star_position[0] + empty_space[0] // 2,
-                star_position[1] * 3 + empty_space[1] // 2,
-                ' * ',
-            )
-        for starbase_position in self.starbases:
-            window.addstr(
-                starbase_position[0] + empty_space[0] // 2,
-                starbase_position[1] * 3 + empty_space[1] // 2,
-                '>!<',
-            )
+        top = (height - required_height) // 2
+        left = (width - required_width) // 2
+        # One call per row, dropping each row's leading separator:
+        for x, row in enumerate(self.render_rows(player_position)):
+            try:
+                window.addstr(top + x, left, row[1:])
+            except curses.error:
+                # Writing the bottom-right cell cannot advance the cursor,
+                # but the text is still drawn.
+                pass
+        klingon_color = curses.color_pair(ColorPair.KLINGON)
+        for x, y in self.klingons.keys():
+            window.chgat(top + x, left + y * 4, 3, klingon_color)
 
 
 class Quadrant:
-    def __init__(self, name: str):
-        self.name = name
-        self.scanned = False
-
-        klingon_roll = random()
-        if klingon_roll > 0.98:
-            self.klingons = 3
-        elif klingon_roll > 0.95:
-            self.klingons = 2
-        elif klingon_roll > 0.80:
-            self.klingons = 1
-        else:
-            self.klingons = 0
+    """A view onto one quadrant's entries in its galaxy's tables."""
+
+    __slots__ = ('galaxy', 'coordinates', '_index')
+
+    def __init__(self, galaxy: 'Galaxy', coordinates: tuple[int, int]):
+        self.galaxy = galaxy
+        self.coordinates = coordinates
+        self._index = galaxy.index(coordinates)
+
+    @property
+    def name(self) -> str:
+        return self.galaxy.names.quadrants[self._index]
+
+    @property
+    def klingons(self) -> int:
+        return self.galaxy.klingon_table[self._index]
+
+    @klingons.setter
+    def klingons(self, value: int):
+        self.galaxy.set_klingons(self.coordinates, value)
+
+    @property
+    def has_starbase(self) -> bool:
+        return bool(self.galaxy.starbase_table[self._index])
+
+    @has_starbase.setter
+    def has_starbase(self, value: bool):
+        self.galaxy.set_starbase(self.coordinates, value)
+
+    @property
+    def seed(self) -> int:
+        return self.galaxy.quadrant_seed(self.coordinates)
+
+    @property
+    def stars(self) -> int:
+        return self.galaxy.star_table[self._index]
 
-        self.stars = randint(1, 8)
-        self.has_starbase = random() > 0.96
+    @property
+    def entered(self) -> bool:
+        return bool(self.galaxy.entered_table[self._index])
+
+    @entered.setter
+    def entered(self, value: bool):
+        self.galaxy.entered_table[self._index] = value
+
+
+class LocalMapCache:
+    """The most recently entered local maps, keyed by quadrant coordinates.
+
+    Cached maps keep their Klingons' positions and strengths between
+    visits. Evicted maps are discarded, leaving only the counts held by the
+    galaxy, and are regenerated from the quadrant's seed on the next visit.
+    """
+
+    __slots__ = ('galaxy', 'capacity', '_maps')
+
+    def __init__(self, galaxy: 'Galaxy', capacity: int = 16):
+        self.galaxy = galaxy
+        self.capacity = capacity
+        self._maps: OrderedDict[tuple[int, int], LocalMap] = OrderedDict()
+
+    def __len__(self):
+        return len(self._maps)
+
+    def __contains__(self, coordinates: tuple[int, int]):
+        return coordinates in self._maps
+
+    def __iter__(self):
+        """Iterates over the cached maps, least recently entered first."""
+        return iter(self._maps.values())
+
+    def add(self, local_map: LocalMap):
+        """Caches a map as the most recently entered."""
+        coordinates = local_map.quadrant.coordinates
+        self._maps[coordinates] = local_map
+        self._maps.move_to_end(coordinates)
+        if len(self._maps) > self.capacity:
+            self._maps.popitem(last=False)
+
+    def get(
+            self,
+            coordinates: tuple[int, int],
+            player_sector_coordinates: tuple[int, int],
+            rng: Random,
+    ):
+        """Returns the local map for a quadrant the player is entering.
+
+        Any object in the player's sector of a cached map is moved to an
+        empty sector chosen with the supplied generator.
+        """
+        local_map = self._maps.get(coordinates)
+        if local_map is None:
+            local_map = LocalMap(
+                quadrant=self.galaxy.quadrants[coordinates],
+                player_sector_coordinates=player_sector_coordinates,
+            )
+            self.add(local_map)
+        else:
+            self._maps.move_to_end(coordinates)
+            local_map.vacate(player_sector_coordinates, rng)
+        return local_map
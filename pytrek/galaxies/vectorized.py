@@ -0,0 +1,73 @@
+"""Vectorised generation of galaxy contents, for bulk workloads.
+
+This module requires NumPy, which the game itself does not depend on.
+"""
+
+from typing import NamedTuple
+
+import numpy as np
+
+from .galaxies import Galaxy
+
+
+class GalaxyTables(NamedTuple):
+    klingons: np.ndarray
+    starbases: np.ndarray
+    stars: np.ndarray
+
+
+def generate_tables(
+        batch: int | None = None,
+        rng: np.random.Generator | None = None,
+        size: int = 8,
+):
+    """Rolls the quadrant contents of one galaxy, or a batch of galaxies.
+
+    The tables have shape (size, size), or (batch, size, size) when a batch
+    size is given, and follow the same distributions as _roll_quadrants in
+    pytrek.galaxies.galaxies, which must be kept in step with this. Any
+    galaxy without a starbase has one inserted, as Galaxy does.
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+    shape = (size, size) if batch is None else (batch, size, size)
+    klingon_rolls = rng.random(shape)
+    klingons = (
+        (klingon_rolls > 0.80).astype(np.int8)
+        + (klingon_rolls > 0.95)
+        + (klingon_rolls > 0.98)
+    )
+    stars = rng.integers(1, 9, shape, dtype=np.int8)
+    starbases = rng.random(shape) > 0.96
+    # Insert a starbase into any galaxy without one:
+    flat_klingons = klingons.reshape(-1, size * size)
+    flat_starbases = starbases.reshape(-1, size * size)
+    rows = np.flatnonzero(~flat_starbases.any(axis=1))
+    columns = rng.integers(0, size * size, rows.size)
+    flat_starbases[rows, columns] = True
+    flat_klingons[rows, columns] += flat_klingons[rows, columns] < 2
+    return GalaxyTables(klingons, starbases, stars)
+
+
+def generate_galaxies(
+        count: int,
+        rng: np.random.Generator | None = None,
+        size: int = 8,
+        quadrant_size: int = 8,
+):
+    """Creates a batch of galaxies from a single vectorised roll."""
+    if rng is None:
+        rng = np.random.default_rng()
+    tables = generate_tables(count, rng, size)
+    seeds = rng.integers(0, 2 ** 63, count)
+    return [
+        Galaxy(
+            size=size,
+            quadrant_size=quadrant_size,
+            klingons=tables.klingons[i].tobytes(),
+            starbases=tables.starbases[i].tobytes(),
+            stars=tables.stars[i].tobytes(),
+            seed=int(seeds[i]),
+        )
+        for i in range(count)
+    ]
@@ -0,0 +1,97 @@
+import json
+
+from collections import deque
+from time import time
+from typing import Any, TextIO
+
+# Frame times kept for the percentiles:
+_FRAME_HISTORY = 240
+
+# Seconds between summaries:
+REPORT_INTERVAL = 1.0
+
+
+def _percentile(values: list[float], fraction: float):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class LoopMetrics:
+    """Timings from the main loop, summarised once per report interval.
+
+    The latest summary is kept for display. Given a path, each summary is
+    also appended to that file as a line of JSON.
+    """
+
+    def __init__(self, path: str | None = None):
+        self.summary: dict[str, Any] | None = None
+        self._frame_times: deque[float] = deque(maxlen=_FRAME_HISTORY)
+        self._file: TextIO | None = None
+        if path is not None:
+            self._file = open(path, 'a')
+        self._previous_draw_counts: dict[str, int] = {}
+        self._reset(time())
+
+    def _reset(self, now: float):
+        self._interval_start = now
+        self._iterations = 0
+        self._frames = 0
+        self._key_wait_time = 0.0
+        self._layout_time = 0.0
+
+    @property
+    def next_report_time(self):
+        """The time.time() at which the current interval ends."""
+        return self._interval_start + REPORT_INTERVAL
+
+    def record_frame(self, duration: float):
+        self._frames += 1
+        self._frame_times.append(duration)
+
+    def record_key_wait(self, duration: float):
+        self._key_wait_time += duration
+
+    def record_layout(self, duration: float):
+        self._layout_time += duration
+
+    def end_iteration(self, draw_counts: dict[str, int]):
+        """Counts a loop iteration, summarising if the interval is over.
+
+        Draw counts are cumulative and keyed by window. Returns whether a
+        new summary was produced.
+        """
+        self._iterations += 1
+        now = time()
+        elapsed = now - self._interval_start
+        if elapsed < REPORT_INTERVAL:
+            return False
+        frame_times = list(self._frame_times)
+        self.summary = {
+            'time': now,
+            'interval': elapsed,
+            'iterations_per_second': self._iterations / elapsed,
+            'frames': self._frames,
+            'frame_time_p50': (
+                _percentile(frame_times, 0.5) if frame_times else None
+            ),
+            'frame_time_p99': (
+                _percentile(frame_times, 0.99) if frame_times else None
+            ),
+            'key_wait_time': self._key_wait_time,
+            'layout_time': self._layout_time,
+            'draws': {
+                name: count - self._previous_draw_counts.get(name, 0)
+                for name, count in draw_counts.items()
+            },
+        }
+        if self._file is not None:
+            self._file.write(json.dumps(self.summary) + '\n')
+            self._file.flush()
+        self._previous_draw_counts = dict(draw_counts)
+        self._reset(now)
+        return True
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
@@ -0,0 +1,29 @@
+from random import Random, getrandbits
+
+_SEED_MASK = (1 << 64) - 1
+
+
+def normalise_seed(seed: int | None = None):
+    """Returns a seed as an unsigned 64-bit integer, or a random one."""
+    return getrandbits(64) if seed is None else seed & _SEED_MASK
+
+
+class RandomStreams:
+    """Independent random number streams for one game, seeded together.
+
+    Each stream is seeded from the game seed and its own name, so drawing
+    more or fewer numbers from one stream (for example, by changing an AI
+    policy) leaves the sequences of the others unchanged.
+    """
+
+    def __init__(self, seed: int | None = None):
+        self.seed = normalise_seed(seed)
+        # Sector layouts and starting positions:
+        self.generation = self._stream('generation')
+        # Klingon movement and firing, phasers, and device damage:
+        self.combat = self._stream('combat')
+        # Simulated players:
+        self.ai = self._stream('ai')
+
+    def _stream(self, name: str):
+        return Random(f'{self.seed}:{name}')
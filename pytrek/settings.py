@@ -1,35 +1,94 @@
+import marshal
 import os
 
-from pydantic import BaseModel, field_serializer
-from pydantic_extra_types.color import Color
-from yaml import safe_dump, safe_load
+from functools import cache
+from typing import NamedTuple
 
+_SETTINGS_PATH = 'settings.yaml'
 
-class _SettingsModel(BaseModel):
-    klingon_color: Color = Color('green')
+# Validated settings are cached here, keyed by the settings file's
+# modification time and size, so that unchanged settings load without
+# pydantic or PyYAML.
+_CACHE_PATH = 'settings.cache'
 
-    @field_serializer('klingon_color', mode='plain')
-    def hex_encode(self, value: Color) -> str:
-        return value.as_hex()
+
+class Settings(NamedTuple):
+    klingon_color: str
+    galaxy_size: int
+    quadrant_size: int
+    local_map_cache_size: int
+    metrics_path: str | None
+
+
+@cache
+def _get_model():
+    # Pydantic is slow to import, so the model is only built when the
+    # settings file is actually read.
+    from pydantic import BaseModel, Field, field_serializer
+    from pydantic_extra_types.color import Color
+
+    class _SettingsModel(BaseModel):
+        klingon_color: Color = Color('green')
+        galaxy_size: int = Field(8, ge=1)
+        quadrant_size: int = Field(8, ge=4)
+        local_map_cache_size: int = Field(16, ge=1)
+        metrics_path: str | None = None
+
+        @field_serializer('klingon_color', mode='plain')
+        def hex_encode(self, value: Color) -> str:
+            return value.as_hex()
+
+    return _SettingsModel
 
 
 def _load_settings():
-    # Create the settings file if necessary.
-    if not os.path.exists('settings.yaml'):
-        with open('settings.yaml', 'w') as _:
-            pass
-    # Load settings from the file.
-    with open('settings.yaml', 'r') as file:
-        data = safe_load(file)
-        if isinstance(data, dict):
-            settings = _SettingsModel.model_validate(data)
-        else:
-            settings = _SettingsModel()
-    # Write any default values to the file.
-    with open('settings.yaml', 'w') as file:
-        safe_dump(settings.model_dump(), file)
-    # Return the loaded settings.
-    return settings
+    from yaml import safe_dump, safe_load
+
+    model = _get_model()
+    data = None
+    if os.path.exists(_SETTINGS_PATH):
+        with open(_SETTINGS_PATH, 'r') as file:
+            data = safe_load(file)
+    if isinstance(data, dict):
+        values = model.model_validate(data).model_dump()
+    else:
+        values = model().model_dump()
+    # Write any default values to the file, if they are not already there.
+    if values != data:
+        with open(_SETTINGS_PATH, 'w') as file:
+            safe_dump(values, file)
+    return Settings(**values)
 
 
-settings = _load_settings()
+def _cache_key():
+    status = os.stat(_SETTINGS_PATH)
+    return (Settings._fields, status.st_mtime_ns, status.st_size)
+
+
+def _read_cache():
+    try:
+        with open(_CACHE_PATH, 'rb') as file:
+            key, values = marshal.load(file)
+        if key == _cache_key():
+            return Settings(*values)
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+    return None
+
+
+def _write_cache(settings: Settings):
+    try:
+        with open(_CACHE_PATH, 'wb') as file:
+            marshal.dump((_cache_key(), tuple(settings)), file)
+    except OSError:
+        pass
+
+
+@cache
+def get_settings():
+    """Returns the settings, loading them from the file on first use."""
+    settings = _read_cache()
+    if settings is None:
+        settings = _load_settings()
+        _write_cache(settings)
+    return settings
@@ -0,0 +1,13 @@
+from .policies import (
+    HunterPolicy as HunterPolicy,
+    load_policy as load_policy,
+    POLICIES as POLICIES,
+    Policy as Policy,
+    RandomPolicy as RandomPolicy,
+)
+from .runner import (
+    MissionResult as MissionResult,
+    play_mission as play_mission,
+    run as run,
+    Summary as Summary,
+)
@@ -0,0 +1,31 @@
+import argparse
+import os
+
+from .runner import run
+
+parser = argparse.ArgumentParser(
+    prog='python -m pytrek.simulate',
+    description='Plays seeded missions headlessly and reports statistics.',
+)
+parser.add_argument('-n', '--games', type=int, default=1000)
+parser.add_argument(
+    '-p',
+    '--policy',
+    default='hunter',
+    help="a registered policy name or a 'module:attribute' path",
+)
+parser.add_argument('-j', '--workers', type=int, default=os.cpu_count())
+parser.add_argument('-o', '--output', default='simulation.jsonl')
+parser.add_argument('-s', '--seed', type=int, default=0)
+parser.add_argument('--max-turns', type=int, default=1000)
+arguments = parser.parse_args()
+
+summary = run(
+    games=arguments.games,
+    output_path=arguments.output,
+    policy=arguments.policy,
+    workers=arguments.workers,
+    seed=arguments.seed,
+    max_turns=arguments.max_turns,
+)
+print(summary.report())
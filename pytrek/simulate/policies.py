@@ -0,0 +1,152 @@
+from importlib import import_module
+from math import floor
+from typing import Callable, Protocol
+
+from ..engine import (
+    AdjustShields,
+    calculate_navigation,
+    Command,
+    COURSE_VECTORS,
+    Engine,
+    FirePhasers,
+    FireTorpedo,
+    get_ray,
+    Navigate,
+    ShortRangeScan,
+)
+
+
+class Policy(Protocol):
+    def __call__(self, engine: Engine) -> Command:
+        """Chooses the next command to execute."""
+        ...
+
+
+def _torpedo_course(engine: Engine):
+    """Returns a course on which a torpedo would hit a Klingon, if any."""
+    local_map = engine.local_map
+    for course in COURSE_VECTORS:
+        ray = get_ray(
+            local_map.size,
+            engine.enterprise.sector_coordinates,
+            course,
+        )
+        hit = ray.first_hit(local_map.occupancy)
+        if hit is not None and ray.sectors[hit] in local_map.klingons:
+            return course
+    return None
+
+
+class HunterPolicy:
+    """Fights Klingons in the current quadrant, then warps to the nearest."""
+
+    def __init__(self):
+        self._last_position: tuple[tuple[int, int], ...] | None = None
+
+    def __call__(self, engine: Engine) -> Command:
+        enterprise = engine.enterprise
+        devices = enterprise.devices
+        klingons = engine.local_map.klingons
+        if (
+            enterprise.energy < 100
+            and enterprise.shields > 0
+            and devices['SHE'].operational
+        ):
+            # Free shield energy for maneuvering and phasers:
+            return AdjustShields(enterprise.shields // 2)
+        if klingons:
+            if (
+                enterprise.shields < 200
+                and enterprise.energy > 400
+                and not enterprise.docked
+                and devices['SHE'].operational
+            ):
+                return AdjustShields(
+                    enterprise.shields + enterprise.energy // 4,
+                )
+            if (
+                enterprise.torpedoes > 0
+                and enterprise.energy >= 2
+                and devices['TOR'].operational
+            ):
+                course = _torpedo_course(engine)
+                if course is not None:
+                    return FireTorpedo(course)
+            if enterprise.energy > 0 and devices['PHA'].operational:
+                strength = sum([x.strength for x in klingons.values()])
+                return FirePhasers(max(1, min(
+                    enterprise.energy // 2,
+                    int(strength * 2),
+                )))
+        return self._navigate(engine)
+
+    def _navigate(self, engine: Engine) -> Command:
+        enterprise = engine.enterprise
+        position = (
+            enterprise.quadrant_coordinates,
+            enterprise.sector_coordinates,
+        )
+        stuck = position == self._last_position
+        self._last_position = position
+        galaxy = engine.galaxy
+        q1, q2 = enterprise.quadrant_coordinates
+        targets = [
+            divmod(index, galaxy.size)
+            for index, klingons in enumerate(galaxy.klingon_table)
+            if klingons > 0 and index != galaxy.index((q1, q2))
+        ]
+        if not targets:
+            return ShortRangeScan()
+        target = min(targets, key=lambda x: max(
+            abs(x[0] - q1),
+            abs(x[1] - q2),
+        ))
+        width = galaxy.quadrant_size
+        start = tuple([
+            q * width + s
+            for q, s in zip(position[0], position[1])
+        ])
+        end = (
+            target[0] * width + width // 2,
+            target[1] * width + width // 2,
+        )
+        data = calculate_navigation(start, end)
+        course = data.direction
+        if stuck:
+            course = engine.streams.ai.choice(list(COURSE_VECTORS))
+        warp_factor = min(
+            8.0 if enterprise.devices['NAV'].operational else 0.2,
+            round(data.distance / width, 1),
+            floor(enterprise.energy * 10.0 / 8.0) / 10.0,
+        )
+        return Navigate(course, max(0.1, warp_factor))
+
+
+class RandomPolicy:
+    """Wanders at random, firing phasers whenever Klingons are present."""
+
+    def __call__(self, engine: Engine) -> Command:
+        enterprise = engine.enterprise
+        rng = engine.streams.ai
+        if engine.local_map.klingons and enterprise.energy > 1:
+            return FirePhasers(rng.randint(1, enterprise.energy // 2 + 1))
+        return Navigate(
+            rng.choice(list(COURSE_VECTORS)),
+            rng.uniform(0.1, 2.0),
+        )
+
+
+POLICIES: dict[str, Callable[[], Policy]] = {
+    'hunter': HunterPolicy,
+    'random': RandomPolicy,
+}
+
+
+def load_policy(name: str) -> Policy:
+    """Instantiates a policy by registered name or 'module:attribute' path."""
+    if name in POLICIES:
+        return POLICIES[name]()
+    module_name, _, attribute = name.partition(':')
+    if not attribute:
+        raise ValueError(f'Unknown policy {name!r}')
+    return getattr(import_module(module_name), attribute)()
@@ -0,0 +1,188 @@
+import json
+
+from collections import Counter
+from dataclasses import asdict, dataclass
+from math import ceil
+from multiprocessing import Pool
+from typing import Iterator
+
+from ..engine import Engine, MissionStatus
+from ..engine.events import Prompt
+from ..rng import RandomStreams
+from .policies import load_policy
+
+# Games are dispatched to workers in blocks to keep queue overheads low.
+_BLOCK_SIZE = 64
+
+# Efficiency ratings are aggregated into fixed-width histogram bins so that
+# the summary uses constant memory however many games are played.
+_EFFICIENCY_BIN_WIDTH = 25.0
+
+
+@dataclass
+class MissionResult:
+    seed: int
+    status: str
+    turns: int
+    stardates: float
+    efficiency: float
+    klingons_destroyed: int
+    energy: list[int]
+
+
+def play_mission(seed: int, policy: str = 'hunter', max_turns: int = 1000):
+    """Plays a single seeded mission to completion."""
+    engine = Engine(streams=RandomStreams(seed))
+    engine.start()
+    player = load_policy(policy)
+    energy = [engine.enterprise.total_energy]
+    turns = 0
+    while engine.status == MissionStatus.ACTIVE and turns < max_turns:
+        events = engine.execute(player(engine))
+        if events and isinstance(events[-1], Prompt):
+            raise ValueError(f'Policy {policy!r} issued an incomplete command')
+        energy.append(engine.enterprise.total_energy)
+        turns += 1
+    galaxy = engine.galaxy
+    return MissionResult(
+        seed=seed,
+        status=engine.status.name,
+        turns=turns,
+        stardates=galaxy.current_date - galaxy.start_date,
+        efficiency=(
+            engine.efficiency
+            if engine.status == MissionStatus.VICTORY else 0.0
+        ),
+        klingons_destroyed=(
+            galaxy.initial_klingon_count - galaxy.klingon_count
+        ),
+        energy=energy,
+    )
+
+
+def _play_block(task: tuple[int, int, str, int]):
+    first_seed, count, policy, max_turns = task
+    return [
+        play_mission(seed, policy, max_turns)
+        for seed in range(first_seed, first_seed + count)
+    ]
+
+
+def _percentile(histogram: Counter, fraction: float, scale: float = 1.0):
+    total = sum(histogram.values())
+    if total == 0:
+        return 0.0
+    threshold = fraction * total
+    cumulative = 0
+    for key in sorted(histogram):
+        cumulative += histogram[key]
+        if cumulative >= threshold:
+            return key * scale
+    return 0.0
+
+
+class Summary:
+    """Incrementally aggregated statistics over many mission results."""
+
+    def __init__(self):
+        self.games = 0
+        self.outcomes: Counter[str] = Counter()
+        self.efficiency: Counter[int] = Counter()
+        self.stardates: Counter[int] = Counter()
+        self._energy_totals: list[int] = []
+        self._energy_counts: list[int] = []
+
+    def add(self, result: MissionResult):
+        self.games += 1
+        self.outcomes[result.status] += 1
+        if result.status == MissionStatus.VICTORY.name:
+            bin_index = int(result.efficiency // _EFFICIENCY_BIN_WIDTH)
+            self.efficiency[bin_index] += 1
+        self.stardates[int(result.stardates)] += 1
+        missing = len(result.energy) - len(self._energy_totals)
+        if missing > 0:
+            self._energy_totals.extend([0] * missing)
+            self._energy_counts.extend([0] * missing)
+        for turn, energy in enumerate(result.energy):
+            self._energy_totals[turn] += energy
+            self._energy_counts[turn] += 1
+
+    @property
+    def win_rate(self):
+        if self.games == 0:
+            return 0.0
+        return self.outcomes[MissionStatus.VICTORY.name] / self.games
+
+    @property
+    def mean_energy(self):
+        """Mean total energy after each turn, over games still in play."""
+        return [
+            total / count
+            for total, count in zip(self._energy_totals, self._energy_counts)
+        ]
+
+    def report(self, energy_points: int = 10):
+        bin_width = _EFFICIENCY_BIN_WIDTH
+        efficiency = [
+            f'P{x} {_percentile(self.efficiency, x / 100.0, bin_width):.0f}'
+            for x in (10, 50, 90)
+        ]
+        stardates = [
+            f'P{x} {_percentile(self.stardates, x / 100.0):.0f}'
+            for x in (10, 50, 90)
+        ]
+        mean_energy = self.mean_energy
+        interval = max(1, ceil(len(mean_energy) / energy_points))
+        energy = [
+            f'{turn}: {value:.0f}'
+            for turn, value in enumerate(mean_energy)
+            if turn % interval == 0
+        ]
+        lines = [
+            f'MISSIONS          {self.games}',
+            f'WIN RATE          {self.win_rate:.1%}',
+            'OUTCOMES          ' + ', '.join([
+                f'{status} {count}'
+                for status, count in self.outcomes.most_common()
+            ]),
+            'EFFICIENCY (WINS) ' + ', '.join(efficiency),
+            'STARDATES USED    ' + ', '.join(stardates),
+            'MEAN ENERGY       ' + ', '.join(energy),
+        ]
+        return '\n'.join(lines)
+
+
+def _tasks(games: int, policy: str, seed: int, max_turns: int):
+    for start in range(0, games, _BLOCK_SIZE):
+        count = min(_BLOCK_SIZE, games - start)
+        yield (seed + start, count, policy, max_turns)
+
+
+def run(
+        games: int,
+        output_path: str,
+        policy: str = 'hunter',
+        workers: int | None = None,
+        seed: int = 0,
+        max_turns: int = 1000,
+):
+    """Plays seeds seed..seed+games-1 and streams results to a JSONL file."""
+    load_policy(policy)  # Fail fast on unknown policies.
+    tasks = _tasks(games, policy, seed, max_turns)
+    summary = Summary()
+    with open(output_path, 'w') as output:
+        if workers == 1:
+            blocks: Iterator[list[MissionResult]] = map(_play_block, tasks)
+            _consume(blocks, output, summary)
+        else:
+            with Pool(workers) as pool:
+                blocks = pool.imap_unordered(_play_block, tasks)
+                _consume(blocks, output, summary)
+    return summary
+
+
+def _consume(blocks, output, summary: Summary):
+    for block in blocks:
+        for result in block:
+            output.write(json.dumps(asdict(result)) + '\n')
+            summary.add(result)
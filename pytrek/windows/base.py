@@ -1,39 +1,10 @@
 import abc
 import curses
 
-from .layout import LayoutMetric, LayoutValue
+from .layout import compile_layout_value, LayoutValue, Rect
 from ..states import State
 
 
-def _calc_position(
-        layout_value: LayoutValue,
-        parent_position: int,
-        parent_size: int,
-):
-    offset = 0.0
-    for component in layout_value:
-        match component.metric:
-            case LayoutMetric.CHARACTERS:
-                offset += component.value
-            case LayoutMetric.PERCENTAGE:
-                offset += parent_size * component.value / 100.0
-    return parent_position + round(offset)
-
-
-def _calc_size(
-        layout_value: LayoutValue,
-        parent_size: int,
-):
-    result = 0.0
-    for component in layout_value:
-        match component.metric:
-            case LayoutMetric.CHARACTERS:
-                result += component.value
-            case LayoutMetric.PERCENTAGE:
-                result += parent_size * component.value / 100.0
-    return round(result)
-
-
 class AbstractWindow(abc.ABC):
     focusable = False
 
@@ -46,40 +17,111 @@ class AbstractWindow(abc.ABC):
             width: LayoutValue = [],
     ):
         self._parent = parent
-        self._top = top
-        self._left = left
-        self._height = height
-        self._width = width
-        self.debug_draw_count = 0
-        self.place()
+        self._layout = tuple([
+            compile_layout_value(layout_value)
+            for layout_value in (height, width, top, left)
+        ])
+        self._solved_rects: dict[Rect, Rect] = {}
+        self.draw_count = 0
+        self.rect = self._solve_rect()
+        self.window = curses.newwin(*self.rect)
+        self._draw_required = True
 
-    def place(self):
+    def _solve_rect(self) -> Rect:
+        """Returns the window's rectangle within its parent's current one.
+
+        Results are memoized by the parent's rectangle, so returning to a
+        terminal size seen before needs no arithmetic.
+        """
         if isinstance(self._parent, curses.window):
             self._parent_window = self._parent
+            parent_rect = (
+                *self._parent.getmaxyx(),
+                *self._parent.getbegyx(),
+            )
         else:
             self._parent_window = self._parent.window
-        parent_top, parent_left = self._parent_window.getbegyx()
-        parent_height, parent_width = self._parent_window.getmaxyx()
-        self.window = curses.newwin(
-            _calc_size(self._height, parent_height),
-            _calc_size(self._width, parent_width),
-            _calc_position(self._top, parent_top, parent_height),
-            _calc_position(self._left, parent_left, parent_width),
-        )
+            parent_rect = self._parent.rect
+        rect = self._solved_rects.get(parent_rect)
+        if rect is None:
+            parent_height, parent_width, parent_top, parent_left = (
+                parent_rect
+            )
+            height, width, top, left = self._layout
+            rect = (
+                height.resolve(parent_height),
+                width.resolve(parent_width),
+                parent_top + top.resolve(parent_height),
+                parent_left + left.resolve(parent_width),
+            )
+            self._solved_rects[parent_rect] = rect
+        return rect
+
+    def place(self):
+        """Fits the window to its parent's current size, in place.
+
+        Parents must be placed before their children.
+        """
+        self.rect = self._solve_rect()
+        height, width, top, left = self.rect
+        # Compare with the window itself, which curses may have clipped:
+        if (
+            self.window.getmaxyx() != (height, width)
+            or self.window.getbegyx() != (top, left)
+        ):
+            try:
+                # Shrink first, so the move cannot cross the screen edge:
+                self.window.resize(1, 1)
+                self.window.mvwin(top, left)
+                self.window.resize(height, width)
+            except curses.error:
+                self.window = curses.newwin(height, width, top, left)
+        self._draw_required = True
+
+    def request_draw(self):
+        """Marks the window to be redrawn in the next frame."""
         self._draw_required = True
 
     @abc.abstractmethod
     def _draw_content(self):
         ...
 
-    def draw(self):
+    def next_deadline(self) -> float | None:
+        """Returns the time of the next scheduled redraw, if there is one."""
+        return None
+
+    def overlaps(self, other: 'AbstractWindow'):
+        """Returns whether this window shares any cells with another."""
+        top, left = self.window.getbegyx()
+        height, width = self.window.getmaxyx()
+        other_top, other_left = other.window.getbegyx()
+        other_height, other_width = other.window.getmaxyx()
+        return (
+            top < other_top + other_height
+            and other_top < top + height
+            and left < other_left + other_width
+            and other_left < left + width
+        )
+
+    def stage(self):
+        """Copies the window, unchanged, to the virtual screen."""
+        self.window.touchwin()
+        self.window.noutrefresh()
+
+    def draw(self) -> bool:
+        """Redraws the window to the virtual screen, if required.
+
+        Returns whether the window was redrawn. The terminal is not updated
+        until curses.doupdate() is called; see Compositor.
+        """
         if not self._draw_required:
-            return
+            return False
         self.window.erase()
         self._draw_content()
-        self.window.refresh()
+        self.window.noutrefresh()
         self._draw_required = False
-        self.debug_draw_count += 1
+        self.draw_count += 1
+        return True
 
 
 class AbstractFocusableWindow(AbstractWindow):
@@ -0,0 +1,34 @@
+import curses
+
+from collections.abc import Sequence
+
+from .base import AbstractWindow
+
+
+class Compositor:
+    """Draws a stack of windows with one terminal update per frame.
+
+    Windows are staged in order, so later windows appear above earlier
+    ones. When a window is redrawn, any later window overlapping it is
+    staged again, without being redrawn, to keep it on top. A single
+    curses.doupdate() then sends only the cells that differ from the
+    screen.
+    """
+
+    def __init__(self):
+        self.frame_count = 0
+
+    def draw(self, windows: Sequence[AbstractWindow]) -> bool:
+        """Draws a frame, returning whether the terminal was updated."""
+        staged: list[AbstractWindow] = []
+        for window in windows:
+            if window.draw():
+                staged.append(window)
+            elif any(window.overlaps(other) for other in staged):
+                window.stage()
+                staged.append(window)
+        if not staged:
+            return False
+        curses.doupdate()
+        self.frame_count += 1
+        return True
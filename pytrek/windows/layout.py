@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 from enum import auto, Enum
+from typing import NamedTuple
 
 
 class LayoutMetric(Enum):
@@ -14,3 +15,29 @@ class LayoutValueComponent:
 
 
 type LayoutValue = list[LayoutValueComponent]
+
+
+# The height, width, top and left of a window, in curses.newwin order:
+type Rect = tuple[int, int, int, int]
+
+
+class CompiledLayoutValue(NamedTuple):
+    """A layout value reduced to characters plus a fraction of the parent."""
+
+    characters: float
+    fraction: float
+
+    def resolve(self, parent_size: int):
+        return round(self.characters + self.fraction * parent_size)
+
+
+def compile_layout_value(layout_value: LayoutValue):
+    characters = 0.0
+    fraction = 0.0
+    for component in layout_value:
+        match component.metric:
+            case LayoutMetric.CHARACTERS:
+                characters += component.value
+            case LayoutMetric.PERCENTAGE:
+                fraction += component.value / 100.0
+    return CompiledLayoutValue(characters, fraction)
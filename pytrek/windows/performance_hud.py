@@ -0,0 +1,60 @@
+import curses
+
+from ..metrics import LoopMetrics
+from .base import AbstractWindow
+from .layout import LayoutValue
+
+
+def _milliseconds(seconds: float | None):
+    return '-' if seconds is None else f'{seconds * 1000.0:.2f} ms'
+
+
+class PerformanceHud(AbstractWindow):
+    """An overlay showing the latest main loop metrics summary."""
+
+    def __init__(
+            self,
+            parent: 'curses.window | AbstractWindow',
+            metrics: LoopMetrics,
+            top: LayoutValue = [],
+            left: LayoutValue = [],
+            height: LayoutValue = [],
+            width: LayoutValue = [],
+    ):
+        super().__init__(parent, top, left, height, width)
+        self._metrics = metrics
+        self._shown_summary = None
+
+    def _draw_content(self):
+        self.window.box()
+        height, width = self.window.getmaxyx()
+        if width <= 4:
+            return
+        self.window.addnstr(0, 2, ' PERFORMANCE (F1) ', width - 4)
+        summary = self._metrics.summary
+        self._shown_summary = summary
+        if summary is None:
+            lines = ['Collecting...']
+        else:
+            lines = [
+                f'Frame p50     {_milliseconds(summary['frame_time_p50'])}',
+                f'Frame p99     {_milliseconds(summary['frame_time_p99'])}',
+                f'Loops/s       {summary['iterations_per_second']:.1f}',
+                f'Key wait      {_milliseconds(summary['key_wait_time'])}',
+                f'Layout        {_milliseconds(summary['layout_time'])}',
+                'Draws:',
+            ]
+            lines += [
+                f'  {name:<18}{count:>4}'
+                for name, count in summary['draws'].items()
+            ]
+        for y, line in enumerate(lines[:height - 2], start=1):
+            self.window.addnstr(y, 2, line, width - 4)
+
+    def next_deadline(self) -> float | None:
+        return self._metrics.next_report_time
+
+    def draw(self) -> bool:
+        if self._metrics.summary is not self._shown_summary:
+            self._draw_required = True
+        return super().draw()
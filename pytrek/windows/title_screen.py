@@ -7,6 +7,7 @@
 import curses
 
 from enum import auto, Enum
+from functools import lru_cache
 from textwrap import wrap
 from time import time
 
@@ -17,7 +18,7 @@ from .layout import LayoutValue
 
 _TITLE_ANIMATION_INTERVAL = 0.1
 
-_TITLE_CONTENT = [
+_TITLE_CONTENT = (
     "                ,------*------,",
     ",-------------   '---  ------' ",
     " '-------- --'      / /        ",
@@ -27,7 +28,20 @@ _TITLE_CONTENT = [
     "THE USS ENTERPRISE --- NCC-1701",
     "                               ",
     "    PRESS ENTER TO PROCEED     ",
-]
+)
+
+
+@lru_cache(maxsize=8)
+def _centre_lines(lines: tuple[str, ...], width: int):
+    """Centres lines within a width, leaving the last column clear."""
+    return tuple([f'{line:^{width}}'[:max(0, width - 1)] for line in lines])
+
+
+@lru_cache(maxsize=8)
+def _layout_orders(orders: str, width: int):
+    lines = wrap(orders, min(60, width))
+    lines += ['', 'PRESS ENTER TO BEGIN YOUR MISSION...']
+    return _centre_lines(tuple(lines), width)
 
 
 class Animation(Enum):
@@ -53,6 +67,13 @@ class TitleScreen(AbstractFocusableWindow):
         self._last_updated = 0.0
         self._orders = ''
 
+    def _draw_lines(self, lines: tuple[str, ...], y_pos: int):
+        height = self.window.getmaxyx()[0]
+        for line in lines:
+            if 0 <= y_pos < height:
+                self.window.addstr(y_pos, 0, line)
+            y_pos += 1
+
     def _draw_show_title(self):
         height, width = self.window.getmaxyx()
         empty_space = height - len(_TITLE_CONTENT)
@@ -60,62 +81,41 @@ class TitleScreen(AbstractFocusableWindow):
         if y_pos < empty_space // 2:
             y_pos = empty_space // 2
             self._animation = Animation.DISPLAY_TITLE
-        for line in _TITLE_CONTENT[:self._animation_stage + 1]:
-            if 0 <= y_pos < height:
-                padded_line = f'{line:{' '}^{width}}'
-                self.window.addnstr(y_pos, 0, padded_line, width - 1)
-            y_pos += 1
+        lines = _centre_lines(_TITLE_CONTENT, width)
+        self._draw_lines(lines[:self._animation_stage + 1], y_pos)
 
     def _draw_display_title(self):
         height, width = self.window.getmaxyx()
         empty_space = height - len(_TITLE_CONTENT)
-        y_pos = empty_space // 2
-        for line in _TITLE_CONTENT:
-            if 0 <= y_pos < height:
-                padded_line = f'{line:{' '}^{width}}'
-                self.window.addnstr(y_pos, 0, padded_line, width - 1)
-            y_pos += 1
+        lines = _centre_lines(_TITLE_CONTENT, width)
+        self._draw_lines(lines, empty_space // 2)
 
     def _draw_hide_title(self):
         height, width = self.window.getmaxyx()
         empty_space = height - len(_TITLE_CONTENT)
         y_pos = empty_space // 2 - self._animation_stage
-        for line in _TITLE_CONTENT:
-            if 0 <= y_pos < height:
-                padded_line = f'{line:{' '}^{width}}{y_pos}'
-                self.window.addnstr(y_pos, 0, padded_line, width - 1)
-            y_pos += 1
-        if y_pos < 0:
+        lines = _centre_lines(_TITLE_CONTENT, width)
+        self._draw_lines(lines, y_pos)
+        if y_pos + len(lines) < 0:
             self._animation = Animation.SHOW_ORDERS
             self._animation_stage = -1
             self._last_updated = 0.0
 
     def _draw_show_orders(self):
         height, width = self.window.getmaxyx()
-        lines = wrap(self._orders, min(60, width))
-        lines += ['', 'PRESS ENTER TO BEGIN YOUR MISSION...']
+        lines = _layout_orders(self._orders, width)
         empty_space = height - len(lines)
         y_pos = height - 1 - self._animation_stage
         if y_pos < empty_space // 2:
             y_pos = empty_space // 2
             self._animation = Animation.DISPLAY_ORDERS
-        for line in lines[:self._animation_stage + 1]:
-            if 0 <= y_pos < height:
-                padded_line = f'{line:{' '}^{width}}'
-                self.window.addnstr(y_pos, 0, padded_line, width - 1)
-            y_pos += 1
+        self._draw_lines(lines[:self._animation_stage + 1], y_pos)
 
     def _draw_display_orders(self):
         height, width = self.window.getmaxyx()
-        lines = wrap(self._orders, min(60, width))
-        lines += ['', 'PRESS ENTER TO BEGIN YOUR MISSION...']
+        lines = _layout_orders(self._orders, width)
         empty_space = height - len(lines)
-        y_pos = empty_space // 2
-        for line in lines:
-            if 0 <= y_pos < height:
-                padded_line = f'{line:{' '}^{width}}'
-                self.window.addnstr(y_pos, 0, padded_line, width - 1)
-            y_pos += 1
+        self._draw_lines(lines, empty_space // 2)
 
     def _draw_content(self):
         match self._animation:
@@ -130,7 +130,7 @@ class TitleScreen(AbstractFocusableWindow):
             case Animation.DISPLAY_ORDERS:
                 self._draw_display_orders()
 
-    def draw(self):
+    def draw(self) -> bool:
         match self._animation:
             case (
                 Animation.SHOW_TITLE |
@@ -144,7 +144,18 @@ class TitleScreen(AbstractFocusableWindow):
                 pass
             case _:
                 pass
-        super().draw()
+        return super().draw()
+
+    def next_deadline(self) -> float | None:
+        match self._animation:
+            case (
+                Animation.SHOW_TITLE |
+                Animation.HIDE_TITLE |
+                Animation.SHOW_ORDERS
+            ):
+                return self._last_updated + _TITLE_ANIMATION_INTERVAL
+            case _:
+                return None
 
     def set_orders(self, orders: str):
         self._orders = orders
@@ -0,0 +1,164 @@
+import argparse
+import asyncio
+import io
+import logging
+import os
+
+from contextlib import redirect_stdout, suppress
+from typing import Callable
+
+from pytrek.galaxies import Galaxy
+from xenterprise import (
+    command_loop,
+    Enterprise,
+    print_briefing,
+    print_mission_end,
+)
+
+# Longest line accepted from a player, in bytes:
+_LINE_LIMIT = 256
+
+# Connections that may wait to be accepted, allowing for many players
+# connecting at once:
+_BACKLOG = 1024
+
+_logger = logging.getLogger(__name__)
+
+
+class Session:
+    """One player's mission, played over a stream connection.
+
+    Sessions hold only their game state and a small output buffer, so one
+    event loop can host many of them.
+    """
+
+    def __init__(
+            self,
+            reader: asyncio.StreamReader,
+            writer: asyncio.StreamWriter,
+            journal_directory: str | None = None,
+    ):
+        self._reader = reader
+        self._writer = writer
+        self._journal_directory = journal_directory
+        self._output = io.StringIO()
+
+    def _call[T](self, function: Callable[..., T], *args) -> T:
+        # The front end prints to sys.stdout. Other sessions share it, but
+        # none can run until this call returns, as it never awaits.
+        with redirect_stdout(self._output):
+            return function(*args)
+
+    async def _flush(self):
+        text = self._output.getvalue()
+        self._output.seek(0)
+        self._output.truncate()
+        self._writer.write(
+            text.replace('\n', '\r\n').encode('ascii', 'replace'),
+        )
+        await self._writer.drain()
+
+    def _start(self):
+        galaxy = Galaxy()
+        print_briefing(galaxy)
+        return Enterprise(galaxy, record=self._journal_directory is not None)
+
+    def _save_journal(self, enterprise: Enterprise):
+        journal = enterprise.journal
+        if journal is None:
+            return
+        path = os.path.join(
+            self._journal_directory,
+            f'{journal.streams_seed:016x}.jsonl',
+        )
+        journal.save(path)
+
+    async def run(self):
+        enterprise = None
+        try:
+            enterprise = self._call(self._start)
+            dialogue = command_loop(enterprise)
+            reply = None
+            while True:
+                try:
+                    prompt = self._call(dialogue.send, reply)
+                except StopIteration:
+                    break
+                self._output.write(prompt)
+                await self._flush()
+                try:
+                    line = await self._reader.readline()
+                except ValueError:
+                    # The player sent an overlong line.
+                    return
+                if not line:
+                    return
+                reply = line.decode('ascii', 'replace').rstrip('\r\n')
+            self._call(print_mission_end, enterprise)
+            await self._flush()
+        except ConnectionError:
+            # The player disconnected.
+            pass
+        except Exception:
+            _logger.exception('Session failed')
+        finally:
+            if enterprise is not None:
+                self._save_journal(enterprise)
+            self._writer.close()
+            with suppress(ConnectionError):
+                await self._writer.wait_closed()
+
+
+async def serve(
+        host: str = 'localhost',
+        port: int = 2323,
+        unix_path: str | None = None,
+        journal_directory: str | None = None,
+):
+    """Hosts a mission for each connection until cancelled."""
+    async def start_session(
+            reader: asyncio.StreamReader,
+            writer: asyncio.StreamWriter,
+    ):
+        await Session(reader, writer, journal_directory).run()
+
+    if unix_path is not None:
+        server = await asyncio.start_unix_server(
+            start_session,
+            unix_path,
+            limit=_LINE_LIMIT,
+            backlog=_BACKLOG,
+        )
+    else:
+        server = await asyncio.start_server(
+            start_session,
+            host,
+            port,
+            limit=_LINE_LIMIT,
+            backlog=_BACKLOG,
+        )
+    async with server:
+        await server.serve_forever()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Hosts text missions over TCP or a Unix socket.',
+    )
+    parser.add_argument('--host', default='localhost')
+    parser.add_argument('-p', '--port', type=int, default=2323)
+    parser.add_argument('-u', '--unix', help='serve on a Unix socket path')
+    parser.add_argument(
+        '-J',
+        '--journal-directory',
+        help="save each session's command journal here",
+    )
+    arguments = parser.parse_args()
+    logging.basicConfig()
+    with suppress(KeyboardInterrupt):
+        asyncio.run(serve(
+            host=arguments.host,
+            port=arguments.port,
+            unix_path=arguments.unix,
+            journal_directory=arguments.journal_directory,
+        ))
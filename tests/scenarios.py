@@ -0,0 +1,67 @@
+from pytrek.engine import Engine, MissionStatus
+from pytrek.engine.events import Event
+from pytrek.rng import RandomStreams
+from pytrek.simulate.policies import load_policy
+
+
+def start_engine(seed: int):
+    """Returns a started engine for a seeded game."""
+    engine = Engine(streams=RandomStreams(seed))
+    engine.start()
+    return engine
+
+
+def play(
+        engine: Engine,
+        turns: int,
+        policy: str = 'random',
+) -> list[list[Event]]:
+    """Plays up to the given number of turns, returning each turn's events.
+
+    The random policy draws only from the engine's AI stream, so two
+    engines in the same state are sent the same commands.
+    """
+    player = load_policy(policy)
+    events = []
+    for _ in range(turns):
+        if engine.status != MissionStatus.ACTIVE:
+            break
+        events.append(engine.execute(player(engine)))
+    return events
+
+
+def game_state(engine: Engine):
+    """Returns the full state of a game as comparable values."""
+    galaxy = engine.galaxy
+    enterprise = engine.enterprise
+    streams = engine.streams
+    return (
+        (galaxy.size, galaxy.quadrant_size, galaxy.local_maps.capacity),
+        (galaxy.seed, streams.seed),
+        galaxy.klingon_table,
+        galaxy.starbase_table,
+        galaxy.star_table,
+        galaxy.entered_table,
+        (galaxy.initial_klingon_count, galaxy.initial_starbase_count),
+        (galaxy.start_date, galaxy.current_date, galaxy.end_date),
+        (enterprise.energy, enterprise.shields, enterprise.torpedoes),
+        enterprise.quadrant_coordinates,
+        enterprise.sector_coordinates,
+        enterprise.docked,
+        enterprise.devices,
+        [
+            (
+                local_map.quadrant.coordinates,
+                local_map.klingons,
+                local_map.stars,
+                local_map.starbases,
+                local_map.repair_factor,
+            )
+            for local_map in galaxy.local_maps
+        ],
+        engine.local_map.quadrant.coordinates,
+        (engine.destroyed, engine.resigned, engine.relieved),
+        # The AI stream is only drawn on by players, not the engine:
+        streams.generation.getstate(),
+        streams.combat.getstate(),
+    )
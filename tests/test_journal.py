@@ -0,0 +1,85 @@
+import pytest
+
+from pytrek.engine import (
+    AdjustShields,
+    CalculateNavigation,
+    ComputerFunction,
+    DamageControl,
+    FirePhasers,
+    FireTorpedo,
+    Journal,
+    LibraryComputer,
+    LongRangeScan,
+    Navigate,
+    Replay,
+    Resign,
+    ShortRangeScan,
+)
+
+from .scenarios import game_state, play, start_engine
+
+
+def _record(seed: int, turns: int = 150):
+    engine = start_engine(seed)
+    journal = Journal.attach(engine)
+    events = play(engine, turns, 'hunter' if seed % 2 else 'random')
+    return engine, journal, events
+
+
+@pytest.mark.parametrize('seed', range(10))
+def test_replay_reproduces_the_events(seed: int):
+    engine, journal, events = _record(seed)
+    replay = Replay(journal)
+    assert [replay.step() for _ in journal.commands] == events
+    assert game_state(replay.engine) == game_state(engine)
+
+
+@pytest.mark.parametrize('seed', range(10))
+def test_seek_reproduces_the_events(seed: int):
+    _, journal, events = _record(seed)
+    replay = Replay(journal, snapshot_interval=10)
+    replay.run()
+    for turn in (len(journal) // 2, 0, len(journal) - 1, 25, 10):
+        turn = min(turn, len(journal) - 1)
+        replay.seek(turn)
+        assert replay.turn == turn
+        assert [
+            replay.step() for _ in journal.commands[turn:turn + 15]
+        ] == events[turn:turn + 15]
+
+
+def test_seek_matches_running_from_the_start():
+    _, journal, _ = _record(1)
+    replay = Replay(journal, snapshot_interval=7)
+    replay.run()
+    turn = len(journal) * 2 // 3
+    fresh = Replay(journal)
+    assert game_state(replay.seek(turn)) == game_state(fresh.run(turn))
+
+
+def test_saved_journal_loads_the_same_commands(tmp_path):
+    engine = start_engine(4)
+    journal = Journal.attach(engine)
+    commands = [
+        ShortRangeScan(),
+        LongRangeScan(),
+        Navigate(),
+        Navigate(1),
+        Navigate(1, 0.5),
+        FirePhasers(100),
+        FireTorpedo(3),
+        AdjustShields(200),
+        DamageControl(True),
+        LibraryComputer(),
+        LibraryComputer(ComputerFunction.GALAXY_MAP),
+        CalculateNavigation((1, 2), (3, 4)),
+        Resign(),
+    ]
+    events = [engine.execute(command) for command in commands]
+    path = str(tmp_path / 'game.jsonl')
+    journal.save(path)
+    loaded = Journal.load(path)
+    assert loaded.commands == commands
+    assert Replay(loaded).run().status == engine.status
+    replay = Replay(loaded)
+    assert [replay.step() for _ in commands] == events
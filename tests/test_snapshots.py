@@ -0,0 +1,77 @@
+import pytest
+
+from pytrek.engine import dump_snapshot, save_snapshot, Snapshot
+from pytrek.galaxies import Galaxy
+from pytrek.rng import RandomStreams
+
+from .scenarios import game_state, play, start_engine
+
+
+@pytest.mark.parametrize('seed', range(20))
+@pytest.mark.parametrize('turns', [0, 7, 40])
+def test_restore_saves_the_same_state(seed: int, turns: int):
+    engine = start_engine(seed)
+    play(engine, turns, 'hunter')
+    restored = Snapshot(dump_snapshot(engine)).restore()
+    assert game_state(restored) == game_state(engine)
+    assert restored.status == engine.status
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_restored_game_plays_out_identically(seed: int):
+    engine = start_engine(seed)
+    play(engine, seed, 'hunter')
+    restored = Snapshot(dump_snapshot(engine)).restore()
+    assert play(restored, 200) == play(engine, 200)
+
+
+def test_restore_keeps_a_galaxy_without_starbases():
+    engine = start_engine(0)
+    galaxy = engine.galaxy
+    for coordinates in galaxy.quadrants:
+        galaxy.set_starbase(coordinates, False)
+    restored = Snapshot(dump_snapshot(engine)).restore()
+    assert restored.galaxy.starbase_count == 0
+    assert restored.galaxy.klingon_table == galaxy.klingon_table
+
+
+def test_restore_with_other_streams_branches_the_game():
+    engine = start_engine(0)
+    snapshot = Snapshot(dump_snapshot(engine))
+    branch = snapshot.restore(RandomStreams(1))
+    assert branch.streams.seed == 1
+    assert branch.enterprise.quadrant_coordinates == (
+        engine.enterprise.quadrant_coordinates
+    )
+
+
+def test_open_maps_a_saved_file(tmp_path):
+    engine = start_engine(3)
+    play(engine, 10)
+    path = str(tmp_path / 'game.snap')
+    save_snapshot(engine, path)
+    with Snapshot.open(path) as snapshot:
+        restored = snapshot.restore()
+    assert game_state(restored) == game_state(engine)
+
+
+@pytest.mark.parametrize('seed', [-5, 1 << 64, (1 << 70) + 3])
+def test_any_seed_can_be_saved(seed: int):
+    streams = RandomStreams(seed)
+    engine = start_engine(seed)
+    assert engine.galaxy.seed == Galaxy(seed=seed).seed == streams.seed
+    restored = Snapshot(dump_snapshot(engine)).restore()
+    assert game_state(restored) == game_state(engine)
+
+
+def test_oversized_galaxy_is_rejected():
+    engine = start_engine(0)
+    engine.galaxy.local_maps.capacity = 1 << 16
+    with pytest.raises(ValueError, match='map cache size'):
+        dump_snapshot(engine)
+
+
+@pytest.mark.parametrize('data', [b'', b'nope' * 100])
+def test_invalid_data_is_rejected(data: bytes):
+    with pytest.raises(ValueError):
+        Snapshot(data)
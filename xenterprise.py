@@ -1,617 +1,393 @@
 import re
 
-from math import ceil, floor, sqrt
-from random import choice, randint, random
-from typing import Callable
+from collections.abc import Generator
+from math import ceil, floor
+
+from pytrek.engine import (
+    AdjustShields,
+    CalculateNavigation,
+    Command,
+    ComputerFunction,
+    DamageControl,
+    DEVICE_COMMANDS,
+    Engine,
+    FirePhasers,
+    FireTorpedo,
+    Journal,
+    LibraryComputer,
+    Navigate,
+    Resign,
+)
+from pytrek.engine.events import (
+    ComputerFunctionRequested,
+    CoordinatesRequested,
+    CourseRequested,
+    DeviceDamaged,
+    DeviceImproved,
+    DeviceInoperative,
+    DevicesRepaired,
+    DeviceStatusReport,
+    Docked,
+    EnterpriseHit,
+    Event,
+    GalacticRecord,
+    GalaxyMap,
+    InsufficientManeuveringEnergy,
+    InsufficientTorpedoEnergy,
+    InvalidCourse,
+    KlingonDestroyed,
+    KlingonHit,
+    KlingonsOpenFire,
+    KlingonUndamaged,
+    LongRangeScanned,
+    NavigationBlocked,
+    NavigationData,
+    NoEnemyShips,
+    OrderNotUnderstood,
+    PerimeterDenied,
+    PhaserUnitsRequested,
+    Prompt,
+    QuadrantEntered,
+    RepairAuthorizationRequested,
+    ShieldsAdjusted,
+    ShieldsDown,
+    ShieldsSupplyManeuver,
+    ShieldsUnchanged,
+    ShieldUnitsRequested,
+    ShortRangeScanned,
+    Stranded,
+    StarbaseDestroyed,
+    StarbaseNavData,
+    StatusReport,
+    TorpedoAbsorbed,
+    TorpedoData,
+    TorpedoesExpended,
+    TorpedoMissed,
+    TorpedoTrack,
+    WarpEnginesDamaged,
+    WarpFactorRejected,
+    WarpFactorRequested,
+)
+from pytrek.galaxies import Galaxy
+
+_INOPERATIVE_MESSAGES = {
+    'SRS': '*** SHORT RANGE SENSORS ARE OUT ***',
+    'LRS': '*** LONG RANGE SENSORS ARE INOPERABLE ***',
+    'PHA': 'PHASERS INOPERATIVE',
+    'TOR': 'PHOTON TUBES ARE NOT OPERATIONAL',
+    'SHE': 'SHIELD CONTROL INOPERABLE',
+    'DAM': 'DAMAGE CONTROL REPORT NOT AVAILABLE',
+    'COM': 'COMPUTER DISABLED',
+}
+
+# Front end routines that need the player's input are generators. Each
+# prompt yielded must be answered by sending the player's reply, so the same
+# dialogue can be driven by input() or by a network session.
+type Dialogue[T] = Generator[str, str, T]
+
+
+def _plural(value: int | float):
+    return 'S' if value != 1 else ''
+
+
+def _print_grid_header(columns: int):
+    print('  ' + ''.join(f'{j + 1:>6}' for j in range(columns)))
+    print(_grid_separator(columns))
+
+
+def _grid_separator(columns: int):
+    return '    ' + ' -----' * columns
 
-from galaxy import Galaxy
 
+class Enterprise:
+    """Text front end driving the engine, printing the results."""
 
-def _navigation_calculator(start: tuple[int, int], end: tuple[int, int]):
-    vertical_movement = end[0] - start[0]
-    horizontal_movement = end[1] - start[1]
-    if vertical_movement == 0:
-        if horizontal_movement > 0:
-            direction = 6
-        elif horizontal_movement < 0:
-            direction = 4
-        else:
-            direction = 5
-    elif horizontal_movement == 0:
-        if vertical_movement > 0:
-            direction = 2
-        elif vertical_movement < 0:
-            direction = 8
-        else:
-            direction = 5
-    else:
-        slope = abs(vertical_movement) / abs(horizontal_movement)
-        if slope <= 0.5:
-            if horizontal_movement > 0.0:
-                direction = 6
-            else:
-                direction = 4
-        elif slope > 4.0:
-            if vertical_movement > 0.0:
-                direction = 2
-            else:
-                direction = 8
-        else:
-            if horizontal_movement > 0.0:
-                if vertical_movement > 0.0:
-                    direction = 3
-                else:
-                    direction = 9
-            else:
-                if vertical_movement > 0.0:
-                    direction = 1
-                else:
-                    direction = 7
-    distance = sqrt(sum([pow(a - b, 2) for a, b in zip(start, end)]))
-    print(f'    DIRECTION = {direction}')
-    print(f'    DISTANCE = {distance:.2f}')
-
-
-class Device:
-    def __init__(
-            self,
-            handler: Callable[[bool], None],
-            name: str,
-            help_text: str,
-            health: float = 0.0,
-    ):
-        self._handler = handler
-        self.name = name
-        self.help_text = help_text
-        self.health = health
+    def __init__(self, galaxy: Galaxy, record: bool = False):
+        self.galaxy = galaxy
+        self._engine = Engine(galaxy)
+        # Records the mission's commands, if requested:
+        self.journal = Journal.attach(self._engine) if record else None
+        self._render_events(self._engine.start())
 
     @property
-    def operational(self):
-        return self.health >= 0.0
-
-    def handle_command(self):
-        self._handler(self.operational)
-
+    def destroyed(self):
+        return self._engine.destroyed
 
-class Enterprise:
-
-    MAX_ENERGY = 3000
-    MAX_TORPEDOES = 10
-
-    def __init__(self, galaxy: Galaxy):
-        self.galaxy = galaxy
-        self.destroyed = False
-        self.resigned = False
-        self.fired = False
-        self.docked = False
-        self.galactic_coordinates = (randint(0, 7), randint(0, 7))
-        self.quadrant_coordinates = (randint(0, 7), randint(0, 7))
-        self.energy = self.MAX_ENERGY
-        self.shields = 0
-        self.torpedoes = self.MAX_TORPEDOES
-
-        # Retrieve a quadrant map:
-        quadrant = galaxy.quadrants[self.galactic_coordinates]
-        self.local_map = quadrant.generate_local_map(self.quadrant_coordinates)
-
-        # Set up devices:
-        self._devices = {
-            'NAV': Device(
-                handler=self._use_warp_engines,
-                name='WARP ENGINES',
-                help_text='TO SET COURSE'
-            ),
-            'SRS': Device(
-                handler=self._use_short_range_sensors,
-                name='SHORT RANGE SENSORS',
-                help_text='FOR SHORT RANGE SENSOR SCAN',
-            ),
-            'LRS': Device(
-                handler=self._use_long_range_sensors,
-                name='LONG RANGE SENSORS',
-                help_text='FOR LONG RANGE SENSOR SCAN',
-            ),
-            'PHA': Device(
-                handler=self._fire_phasers,
-                name='PHASER CONTROL',
-                help_text='TO FIRE PHASERS',
-            ),
-            'TOR': Device(
-                handler=self._fire_torpedo,
-                name='PHOTON TUBES',
-                help_text='TO FIRE PHOTON TORPEDOES',
-            ),
-            'SHE': Device(
-                handler=self._adjust_shields,
-                name='SHIELD CONTROL',
-                help_text='TO RAISE OR LOWER SHIELDS',
-            ),
-            'DAM': Device(
-                handler=self._damage_control,
-                name='DAMAGE CONTROL',
-                help_text='FOR DAMAGE CONTROL REPORTS',
-            ),
-            'COM': Device(
-                handler=self._use_library_computer,
-                name='LIBRARY-COMPUTER',
-                help_text='TO CALL ON LIBRARY-COMPUTER',
-            )
-        }
-        self._device_keys = list(self._devices.keys())
-
-        # Officially enter the starting quadrant:
-        self._new_quadrant_handler()
+    @property
+    def resigned(self):
+        return self._engine.resigned
 
     @property
-    def total_energy(self):
-        return self.energy + self.shields
-
-    def handle_command(self, command: str):
-        self._docking_check()
-        if command in self._devices:
-            self._devices[command].handle_command()
-            self._stranded_check()
+    def fired(self):
+        return self._engine.relieved
+
+    def handle_command(self, command: str) -> Dialogue[None]:
+        if command in DEVICE_COMMANDS:
+            yield from self._run(DEVICE_COMMANDS[command]())
         elif command == 'XXX':
-            self.resigned = True
+            yield from self._run(Resign())
         else:
             print('ENTER ONE OF THE FOLLOWING:')
-            for key, value in self._devices.items():
-                print(f'  {key}  ({value.help_text})')
+            for key, device in self._engine.enterprise.devices.items():
+                print(f'  {key}  ({device.help_text})')
             print('  XXX  (TO RESIGN YOUR COMMAND)')
             print()
 
-    def _docking_check(self):
-        self.docked = False
-        for i in range(-1, +2):
-            for j in range(-1, +2):
-                if (tuple([
-                    x + y
-                    for x, y
-                    in zip(self.quadrant_coordinates, (i, j))
-                ])) in self.local_map.starbases:
-                    self.docked = True
-                    self.energy = self.MAX_ENERGY
-                    self.shields = 0
-                    self.torpedoes = self.MAX_TORPEDOES
-                    print('SHIELDS DROPPED FOR DOCKING PURPOSES')
-                    return
-
-    def _stranded_check(self):
-        if self.energy > 10:
-            return
-        elif self.energy + self.shields > 10:
-            if self._devices['SHE'].operational:
-                return
-        print("** FATAL ERROR **   YOU'VE JUST STRANDED YOUR SHIP IN SPACE")
-        print("YOU HAVE INSUFFICIENT MANEUVERING ENERGY, AND SHIELD CONTROL")
-        print("IS PRESENTLY INCAPABLE OF CROSS-CIRCUITING TO ENGINE ROOM!!")
-        self.destroyed = True
-
-    def _new_quadrant_handler(self):
-        quadrant = self.galaxy.quadrants[self.galactic_coordinates]
-        quadrant.entered = True
-        self.local_map = quadrant.generate_local_map(self.quadrant_coordinates)
-        if self.galaxy.current_date == self.galaxy.start_date:
-            print('YOUR MISSION BEGINS WITH YOUR STARSHIP LOCATED')
-            print(f'IN THE GALACTIC QUADRANT {quadrant.name}')
-        else:
-            print(f'NOW ENTERING {quadrant.name} QUADRANT . . .')
-        print()
-        if quadrant.klingons > 0:
-            print('COMBAT AREA      CONDITION RED'.center(30))
-            if self.shields <= 200:
-                print('SHIELDS DANGEROUSLY LOW'.center(30))
-        self.handle_command('SRS')
-
-    def _process_klingon_moves(self):
-        # Live Klingons get moved randomly, moves to a random empty space:
-        for position in list(self.local_map.klingons.keys()):
-            klingon = self.local_map.klingons.pop(position)
-            if klingon.energy <= 0.0:
-                continue
-            empty_sectors = self.local_map.get_empty_sectors(
-                enterprise_sector=self.quadrant_coordinates,
-            )
-            new_position = choice(empty_sectors)
-            self.local_map.klingons[new_position] = klingon
-
-    def _process_klingon_firing(self):
-        if self.local_map.klingons:
-            print('KLINGONS OPEN FIRE!')
-            if self.docked:
-                print('STARBASE SHIELDS PROTECT THE ENTERPRISE')
+    def _run(self, command: Command | None) -> Dialogue[None]:
+        while command is not None:
+            events = self._engine.execute(command)
+            self._render_events(events)
+            if not events or not isinstance(events[-1], Prompt):
                 return
-        else:
-            return
-        for position, klingon in self.local_map.klingons.items():
-            distance = sqrt(sum([
-                pow(x - y, 2)
-                for x, y in zip(self.quadrant_coordinates, position)
-            ]))
-            damage = int((klingon.energy / distance) * (2.0 + random()))
-            klingon.energy /= (3.0 + random())
-            print((
-                f'{damage}-UNIT HIT ON ENTERPRISE FROM SECTOR '
-                f'{position[0]}, {position[1]}'
-            ))
-            if damage >= self.shields:
-                self.destroyed = True
-                return
-            self.shields -= damage
-            print((
-                f'      <SHIELDS DOWN TO {self.shields} '
-                f'UNIT{'S' if self.shields != 1 else ''}>'
-            ))
-            if random() > 0.4 and damage / self.shields > 0.02:
-                target = self._devices[choice(self._device_keys)]
-                target.health -= (damage / self.shields) + 0.5 * random()
-                print((
-                    f"DAMAGE CONTROL REPORTS '{target.name} "
-                    f"DAMAGED BY THE HIT'"
+            command = yield from self._answer_prompt(events[-1])
+
+    def _device_name(self, key: str):
+        return self._engine.enterprise.devices[key].name
+
+    def _answer_prompt(self, prompt: Prompt) -> Dialogue[Command | None]:
+        match prompt:
+            case CourseRequested(device=device):
+                return (yield from self._request_course(device))
+            case WarpFactorRequested(course=course, max_factor=max_factor):
+                value = yield f'WARP FACTOR (0.0-{max_factor:.1f}): '
+                if not value:
+                    return None
+                try:
+                    return Navigate(course, float(value))
+                except ValueError:
+                    self._render_event(OrderNotUnderstood('NAV'))
+                    return None
+            case PhaserUnitsRequested():
+                value = yield 'NUMBER OF UNITS TO FIRE: '
+                if not value.isdigit():
+                    return None
+                return FirePhasers(int(value))
+            case ShieldUnitsRequested(total_energy=total_energy):
+                info = f'ENERGY AVAILABLE = {total_energy}'
+                value = yield info + ' NUMBER OF UNITS TO SHIELDS: '
+                if not value.isdigit():
+                    self._render_event(OrderNotUnderstood('SHE'))
+                    return None
+                return AdjustShields(int(value))
+            case RepairAuthorizationRequested():
+                value = yield 'WILL YOU AUTHORIZE THE REPAIR ORDER? (Y/N) '
+                return DamageControl(value.strip().upper() == 'Y')
+            case ComputerFunctionRequested():
+                return LibraryComputer(ComputerFunction(
+                    (yield from self._request_computer_function()),
                 ))
+            case CoordinatesRequested():
+                return (yield from self._request_coordinates())
+            case _:
+                return None
 
-    def _damage_control_report(self, warp_factor: float):
-        repair = min(1.0, warp_factor)
-        damaged_devices = [
-            device
-            for device in self._devices.values()
-            if not device.operational
-        ]
-        first_event = True
-        for device in damaged_devices:
-            device.health = device.health + repair
-            if device.operational:
-                if first_event:
-                    print('DAMAGE CONTROL REPORT:')
-                    first_event = False
-                print(f'\t{device.name} REPAIR COMPLETED.')
-        if random() >= 0.2:
-            return
-        random_device = self._devices[choice(self._device_keys)]
-        if random() >= 0.6:
-            random_device.health += random() * 3.0 + 1.0
-            print((
-                f'DAMAGE CONTROL REPORT: {random_device.name} STATE OF REPAIR '
-                f'IMPROVED.\n'
-            ))
+    def _request_course(self, device: str) -> Dialogue[Command | None]:
+        if device == 'NAV':
+            value = (yield 'COURSE (1-9): ').strip()
         else:
-            random_device.health -= random() * 0.5 + 1.0
-            print(f'DAMAGE CONTROL REPORT: {random_device.name} DAMAGED.\n')
-
-    def _use_warp_engines(self, device_operational: bool):
-        match input('COURSE (1-9): ').strip():
-            case '1':
-                direction_vector = [+1, -1]
-            case '2':
-                direction_vector = [+1, +0]
-            case '3':
-                direction_vector = [+1, +1]
-            case '4':
-                direction_vector = [+0, -1]
-            case '6':
-                direction_vector = [+0, +1]
-            case '7':
-                direction_vector = [-1, -1]
-            case '8':
-                direction_vector = [-1, +0]
-            case '9':
-                direction_vector = [-1, +1]
-            case '':
-                return
-            case _:
+            value = (yield 'PHOTON TORPEDO COURSE (1-9): ').strip()
+        if not value:
+            return None
+        elif not value.isdigit():
+            self._render_event(InvalidCourse(device))
+            return None
+        elif device == 'NAV':
+            return Navigate(int(value))
+        return FireTorpedo(int(value))
+
+    def _request_computer_function(self) -> Dialogue[int]:
+        value = (yield 'COMPUTER ACTIVE AND AWAITING COMMAND: ').strip()
+        while not value.isdigit() or not 0 <= int(value) <= 6:
+            print('FUNCTIONS AVAILABLE FROM LIBRARY-COMPUTER:')
+            print('   0 = CUMULATIVE GALACTIC RECORD')
+            print('   1 = STATUS REPORT')
+            print('   2 = PHOTON TORPEDO DATA')
+            print('   3 = STARBASE NAV DATA')
+            print('   4 = DIRECTION/DISTANCE CALCULATOR')
+            print("   5 = GALAXY 'REGION NAME' MAP")
+            print('   6 = CANCEL')
+            print()
+            value = (yield 'COMPUTER ACTIVE AND AWAITING COMMAND: ').strip()
+        return int(value)
+
+    def _request_coordinates(self) -> Dialogue[CalculateNavigation | None]:
+        pattern = r'^.*?([+-]?\d+).*,.*?([+-]?\d+).*$'
+        value = yield '  INITIAL COORDINATES (X, Y) '
+        start_match = re.match(pattern, value)
+        if not start_match:
+            print('INVALID INPUT')
+            return None
+        value = yield '  FINAL COORDINATES (X, Y) '
+        end_match = re.match(pattern, value)
+        if not end_match:
+            print('INVALID INPUT')
+            return None
+        return CalculateNavigation(
+            start=(int(start_match.group(1)), int(start_match.group(2))),
+            end=(int(end_match.group(1)), int(end_match.group(2))),
+        )
+
+    def _render_events(self, events: list[Event]):
+        for event in events:
+            self._render_event(event)
+
+    def _render_event(self, event: Event):
+        match event:
+            case Docked():
+                print('SHIELDS DROPPED FOR DOCKING PURPOSES')
+            case Stranded():
+                print((
+                    "** FATAL ERROR **   YOU'VE JUST STRANDED YOUR SHIP IN "
+                    "SPACE"
+                ))
+                print((
+                    'YOU HAVE INSUFFICIENT MANEUVERING ENERGY, AND SHIELD '
+                    'CONTROL'
+                ))
+                print((
+                    'IS PRESENTLY INCAPABLE OF CROSS-CIRCUITING TO ENGINE '
+                    'ROOM!!'
+                ))
+            case DeviceInoperative(device=device):
+                print(_INOPERATIVE_MESSAGES[device])
+            case OrderNotUnderstood(device='NAV'):
+                print("CHIEF ENGINEER SCOTT REPORTS 'ORDER NOT UNDERSTOOD.'")
+            case OrderNotUnderstood():
+                print("SHIELD CONTROL REPORTS  'ORDER NOT UNDERSTOOD.'")
+                print('<SHIELDS UNCHANGED>')
+            case InvalidCourse(device='NAV'):
                 print("   LT. SULU REPORTS, 'INCORRECT COURSE DATA, SIR!'")
-                return
-        max_factor = 8.0 if device_operational else 0.2
-        factor = input(f'WARP FACTOR (0.0-{max_factor:.1f}): ')
-        if not factor:
-            return
-        try:
-            factor = round(float(factor), 1)
-            if factor == 0.0:
-                return
-            elif factor > max_factor and not device_operational:
+            case InvalidCourse():
+                print(
+                    "   ENSIGN CHEKOV REPORTS, 'INCORRECT COURSE DATA, SIR!'",
+                )
+            case QuadrantEntered():
+                self._render_quadrant_entered(event)
+            case WarpEnginesDamaged():
                 print('WARP ENGINES ARE DAMAGED.  MAXIMUM SPEED = WARP 0.2')
-                return
-            elif not 0.0 < factor <= max_factor:
+            case WarpFactorRejected(warp_factor=factor):
                 print((
                     f"   CHIEF ENGINEER SCOTT REPORTS 'THE ENGINES WON'T TAKE "
                     f"WARP {factor:.2f}!'"
                 ))
-                return
-        except ValueError:
-            print("CHIEF ENGINEER SCOTT REPORTS 'ORDER NOT UNDERSTOOD.'")
-            return
-        cost = int(factor * 8.0 + 0.5)
-        if cost > self.energy:
-            print("ENGINEERING REPORTS   'INSUFFICIENT ENERGY AVAILABLE")
-            print(f"                       FOR MANEUVERING AT WARP {factor}!'")
-            if self._devices['SHE'].operational and self.total_energy >= cost:
+            case InsufficientManeuveringEnergy():
+                print("ENGINEERING REPORTS   'INSUFFICIENT ENERGY AVAILABLE")
                 print((
-                    f'DEFLECTOR CONTROL ROOM ACKNOWLEDGES {self.shields} '
-                    f'UNIT{'S' if self.shields != 1 else ''} OF ENERGY'
+                    f"                       FOR MANEUVERING AT WARP "
+                    f"{event.warp_factor}!'"
                 ))
-                print(
-                    '                         PRESENTLY DEPLOYED TO SHIELDS.',
-                )
-            return
-        # Klingons respond to movement:
-        self._process_klingon_moves()
-        self._process_klingon_firing()
-        self._damage_control_report(factor)
-        # Enterprise moves:
-        initial_position = [
-            self.galactic_coordinates[i] * 8 + self.quadrant_coordinates[i]
-            for i in range(2)
-        ]
-        destination_sector = list(self.quadrant_coordinates)
-        destination_quadrant = list(self.galactic_coordinates)
-        new_quadrant = False
-        out_of_bounds = False
-        for _ in range(cost):
-            for i in range(2):
-                destination_sector[i] += direction_vector[i]
-                if destination_sector[i] < 0:
-                    if destination_quadrant[i] > 0:
-                        new_quadrant = True
-                        destination_quadrant[i] -= 1
-                        destination_sector[i] = 7
-                        break
-                    else:
-                        out_of_bounds = True
-                        destination_sector[i] -= direction_vector[i]
-                        break
-                elif destination_sector[i] > 7:
-                    if destination_quadrant[i] < 7:
-                        new_quadrant = True
-                        destination_quadrant[i] += 1
-                        destination_sector[i] = 0
-                        break
-                    else:
-                        out_of_bounds = True
-                        destination_sector[i] -= direction_vector[i]
-                        break
-            if not new_quadrant:
-                collision = False
-                if tuple(destination_sector) in self.local_map.klingons:
-                    collision = True
-                elif tuple(destination_sector) in self.local_map.starbases:
-                    collision = True
-                elif tuple(destination_sector) in self.local_map.stars:
-                    collision = True
-                if collision:
+                if event.shields_available:
                     print((
-                        f'WARP ENGINES SHUT DOWN AT SECTOR '
-                        f'{self.quadrant_coordinates[0]}, '
-                        f'{self.quadrant_coordinates[1]} DUE TO BAD NAVIGATION'
+                        f'DEFLECTOR CONTROL ROOM ACKNOWLEDGES {event.shields} '
+                        f'UNIT{_plural(event.shields)} OF ENERGY'
                     ))
-                    break
-            self.galactic_coordinates = tuple(destination_quadrant)
-            self.quadrant_coordinates = tuple(destination_sector)
-            if new_quadrant or out_of_bounds:
-                self.galaxy.current_date += 1
-                self.energy -= cost + 10
-                if self.energy < 0:
                     print((
-                        'SHIELD CONTROL SUPPLIES ENERGY TO COMPLETE THE '
-                        'MANEUVER.'
+                        '                         PRESENTLY DEPLOYED TO '
+                        'SHIELDS.'
                     ))
-                    self.shields = max(self.shields + self.energy, 0)
-                    self.energy = 0
-                break
-        if new_quadrant:
-            final_position = [
-                max(0, min(x + y, 63))
-                for x, y in zip(
-                    initial_position,
-                    [x * cost for x in direction_vector],
-                )
-            ]
-            self.galactic_coordinates = tuple([x // 8 for x in final_position])
-            self.quadrant_coordinates = tuple([x % 8 for x in final_position])
-            self._new_quadrant_handler()
-        elif out_of_bounds:
-            print("LT. UHURA REPORTS MESSAGE FROM STARFLEET COMMAND:")
-            print("  'PERMISSION TO ATTEMPT CROSSING OF GALACTIC PERIMETER")
-            print("  IS HEREBY *DENIED*.  SHUT DOWN YOUR ENGINES.'")
-            print("CHIEF ENGINEER SCOTT REPORTS  'WARP ENGINES SHUT DOWN")
-            print((
-                f"  AT SECTOR {destination_sector[0]}, "
-                f"{destination_sector[1]} OF QUADRANT "
-                f"{destination_quadrant[0]}, {destination_quadrant[1]}.'"
-            ))
-        else:
-            self.galaxy.current_date += min(0.1 * int(factor * 10.0), 1.0)
-            self.energy -= cost + 10
-            if self.energy < 0:
+            case NavigationBlocked(sector=(x, y)):
+                print((
+                    f'WARP ENGINES SHUT DOWN AT SECTOR {x}, {y} DUE TO BAD '
+                    f'NAVIGATION'
+                ))
+            case ShieldsSupplyManeuver():
                 print((
                     'SHIELD CONTROL SUPPLIES ENERGY TO COMPLETE THE '
                     'MANEUVER.'
                 ))
-                self.shields = max(self.shields + self.energy, 0)
-                self.energy = 0
-
-    def _use_short_range_sensors(self, device_operational: bool):
-        if not device_operational:
-            print('*** SHORT RANGE SENSORS ARE OUT ***')
-            return
-        if self.local_map.klingons:
-            condition = 'RED'
-        elif self.energy < 0.1 * self.MAX_ENERGY:
-            condition = 'YELLOW'
-        else:
-            condition = 'GREEN'
-        g1, g2 = self.galactic_coordinates
-        s1, s2 = self.quadrant_coordinates
-        lines = [''] * 8
-        for i in range(8):
-            for j in range(8):
-                sector = (i, j)
-                if sector == self.quadrant_coordinates:
-                    lines[i] += ' <*>'
-                elif sector in self.local_map.klingons:
-                    lines[i] += ' +K+'
-                elif sector in self.local_map.starbases:
-                    lines[i] += ' >!<'
-                elif sector in self.local_map.stars:
-                    lines[i] += '  * '
-                else:
-                    lines[i] += '    '
-        current_date = floor(self.galaxy.current_date)
-        lines[0] += f'        STARDATE           {current_date}'
-        lines[1] += f'        CONDITION          {condition}'
-        lines[2] += f'        QUADRANT           {g1}, {g2}'
-        lines[3] += f'        SECTOR             {s1}, {s2}'
-        lines[4] += f'        PHOTON TORPEDOES   {self.torpedoes}'
-        lines[5] += f'        TOTAL ENERGY       {self.energy + self.shields}'
-        lines[6] += f'        SHIELDS            {self.shields}'
-        lines[7] += f'        KLINGONS REMAINING {self.galaxy.klingon_count}'
-        print('-' * 33)
-        print('\n'.join(lines))
-        print('-' * 33)
-
-    def _use_long_range_sensors(self, device_operational: bool):
-        if not device_operational:
-            print('*** LONG RANGE SENSORS ARE INOPERABLE ***')
-            return
-        q1, q2 = self.galactic_coordinates
-        print(f'LONG RANGE SCAN FOR QUADRANT {q1}, {q2}')
-        print('-------------------')
-        for x in range(q1 - 1, q1 + 2):
-            if not 0 <= x <= 7:
-                print(' '.join([':'] + ['***'] * 3 + [':']))
-                continue
-            scan_line_components = []
-            for y in range(q2 - 1, q2 + 2):
-                if 0 <= y <= 7:
-                    scan_line_components.append((
-                        f'{int(self.galaxy.quadrants[(x, y)].klingons)}'
-                        f'{int(self.galaxy.quadrants[(x, y)].has_starbase)}'
-                        f'{int(self.galaxy.quadrants[(x, y)].stars)}'
-                    ))
-                else:
-                    scan_line_components.append('***')
-            print(' '.join([':'] + scan_line_components + [':']))
-
-    def _fire_phasers(self, device_operational: bool):
-        if not device_operational:
-            print('PHASERS INOPERATIVE')
-            return
-        elif not self.local_map.klingons:
-            print(
-                "SCIENCE OFFICER SPOCK REPORTS  'SENSORS SHOW NO ENEMY SHIPS",
-            )
-            print("                                IN THIS QUADRANT'")
-            return
-        if not self._devices['COM'].operational:
-            print('COMPUTER FAILURE HAMPERS ACCURACY')
-        print((
-            f'PHASERS LOCKED ON TARGET;  ENERGY AVAILABLE = {self.energy} '
-            f'UNIT{'S' if self.energy != 1 else ''}'
-        ))
-        value = input('NUMBER OF UNITS TO FIRE: ')
-        if not value.isdigit() or int(value) == 0 or int(value) > self.energy:
-            return
-        value = float(value)
-        self.energy -= int(value)
-        if not self._devices['COM'].operational:
-            value *= random()
-        base_damage = value / len(self.local_map.klingons)
-        for position in list(self.local_map.klingons.keys()):
-            klingon = self.local_map.klingons[position]
-            distance = sqrt(sum([
-                pow(x - y, 2)
-                for x, y in zip(self.quadrant_coordinates, position)
-            ]))
-            damage = (base_damage / distance) * (random() + 2.0)
-            if damage <= 0.15 * klingon.energy:
+            case PerimeterDenied(quadrant=(q1, q2), sector=(s1, s2)):
+                print('LT. UHURA REPORTS MESSAGE FROM STARFLEET COMMAND:')
+                print("  'PERMISSION TO ATTEMPT CROSSING OF GALACTIC PERIMETER")
+                print("  IS HEREBY *DENIED*.  SHUT DOWN YOUR ENGINES.'")
+                print("CHIEF ENGINEER SCOTT REPORTS  'WARP ENGINES SHUT DOWN")
+                print(f"  AT SECTOR {s1}, {s2} OF QUADRANT {q1}, {q2}.'")
+            case DevicesRepaired(devices=devices):
+                print('DAMAGE CONTROL REPORT:')
+                for key in devices:
+                    print(f'\t{self._device_name(key)} REPAIR COMPLETED.')
+            case DeviceImproved(device=key):
                 print((
-                    f'SENSORS SHOW NO DAMAGE TO ENEMY AT {position[0]}, '
-                    f'{position[1]}'
+                    f'DAMAGE CONTROL REPORT: {self._device_name(key)} STATE '
+                    f'OF REPAIR IMPROVED.\n'
                 ))
-                continue
-            klingon.energy -= damage
-            print((
-                f'{ceil(damage)}-UNIT HIT ON KLINGON AT SECTOR {position[0]}, '
-                f'{position[1]}'
-            ))
-            if klingon.energy <= 0.0:
-                print('*** KLINGON DESTROYED ***')
-                self.local_map.klingons.pop(position)
-                self.galaxy.quadrants[self.galactic_coordinates].klingons -= 1
-            else:
+            case DeviceDamaged(device=key, by_hit=True):
                 print((
-                    f'   (SENSORS SHOW {ceil(klingon.energy)} '
-                    f'UNIT{'S' if ceil(klingon.energy) != 1 else ''} '
-                    'REMAINING)'
+                    f"DAMAGE CONTROL REPORTS '{self._device_name(key)} "
+                    f"DAMAGED BY THE HIT'"
                 ))
-        self._process_klingon_firing()
-
-    def _fire_torpedo(self, device_operational: bool):
-        if not device_operational:
-            print('PHOTON TUBES ARE NOT OPERATIONAL')
-            return
-        elif self.torpedoes <= 0:
-            print('ALL PHOTON TORPEDOES EXPENDED')
-            return
-        elif self.energy < 2:
-            print('INSUFFICIENT ENERGY TO FIRE TORPEDOES')
-            return
-        match input('PHOTON TORPEDO COURSE (1-9): ').strip():
-            case '1':
-                direction_vector = [+1, -1]
-            case '2':
-                direction_vector = [+1, +0]
-            case '3':
-                direction_vector = [+1, +1]
-            case '4':
-                direction_vector = [+0, -1]
-            case '6':
-                direction_vector = [+0, +1]
-            case '7':
-                direction_vector = [-1, -1]
-            case '8':
-                direction_vector = [-1, +0]
-            case '9':
-                direction_vector = [-1, +1]
-            case '':
-                return
-            case _:
+            case DeviceDamaged(device=key):
+                print((
+                    f'DAMAGE CONTROL REPORT: {self._device_name(key)} '
+                    f'DAMAGED.\n'
+                ))
+            case DeviceStatusReport(devices=devices):
+                print()
+                print('DEVICE             STATE OF REPAIR')
+                for key, health in devices:
+                    print(f'{self._device_name(key):<19}{health:>15.2f}')
+                print()
+            case ShortRangeScanned():
+                self._render_short_range_scan(event)
+            case LongRangeScanned(quadrant=(q1, q2), rows=rows):
+                print(f'LONG RANGE SCAN FOR QUADRANT {q1}, {q2}')
+                print('-------------------')
+                for row in rows:
+                    print(' '.join([':'] + [
+                        '***' if cell is None else ''.join(map(str, cell))
+                        for cell in row
+                    ] + [':']))
+            case NoEnemyShips():
                 print(
-                    "   ENSIGN CHEKOV REPORTS, 'INCORRECT COURSE DATA, SIR!'",
+                    "SCIENCE OFFICER SPOCK REPORTS  'SENSORS SHOW NO ENEMY "
+                    "SHIPS",
                 )
-                return
-        self.energy -= 2
-        self.torpedoes -= 1
-        torpedo_position = self.quadrant_coordinates
-        print('TORPEDO TRACK:')
-        for _ in range(8):
-            torpedo_position = tuple([
-                current_position + movement
-                for current_position, movement
-                in zip(list(torpedo_position), direction_vector)
-            ])
-            within_bounds = all([0 <= x <= 7 for x in torpedo_position])
-            if not within_bounds:
+                print("                                IN THIS QUADRANT'")
+            case PhaserUnitsRequested(energy=energy):
+                if event.computer_damaged:
+                    print('COMPUTER FAILURE HAMPERS ACCURACY')
+                print((
+                    f'PHASERS LOCKED ON TARGET;  ENERGY AVAILABLE = {energy} '
+                    f'UNIT{_plural(energy)}'
+                ))
+            case KlingonsOpenFire(docked=docked):
+                print('KLINGONS OPEN FIRE!')
+                if docked:
+                    print('STARBASE SHIELDS PROTECT THE ENTERPRISE')
+            case EnterpriseHit(damage=damage, sector=(x, y)):
+                print(f'{damage}-UNIT HIT ON ENTERPRISE FROM SECTOR {x}, {y}')
+            case ShieldsDown(shields=shields):
+                print((
+                    f'      <SHIELDS DOWN TO {shields} '
+                    f'UNIT{_plural(shields)}>'
+                ))
+            case KlingonUndamaged(sector=(x, y)):
+                print(f'SENSORS SHOW NO DAMAGE TO ENEMY AT {x}, {y}')
+            case KlingonHit(damage=damage, sector=(x, y)):
+                print(f'{ceil(damage)}-UNIT HIT ON KLINGON AT SECTOR {x}, {y}')
+                if event.remaining > 0.0:
+                    remaining = ceil(event.remaining)
+                    print((
+                        f'   (SENSORS SHOW {remaining} '
+                        f'UNIT{_plural(remaining)} REMAINING)'
+                    ))
+            case KlingonDestroyed():
+                print('*** KLINGON DESTROYED ***')
+            case TorpedoesExpended():
+                print('ALL PHOTON TORPEDOES EXPENDED')
+            case InsufficientTorpedoEnergy():
+                print('INSUFFICIENT ENERGY TO FIRE TORPEDOES')
+            case TorpedoTrack(sectors=sectors):
+                print('TORPEDO TRACK:')
+                for x, y in sectors:
+                    print(f'               {x}, {y}')
+            case TorpedoMissed():
                 print('               QUADRANT LIMIT')
                 print('TORPEDO MISSED')
-                break
-            x, y = torpedo_position
-            print(f'               {x}, {y}')
-            if torpedo_position in self.local_map.klingons:
-                print('*** KLINGON DESTROYED ***')
-                self.local_map.klingons.pop(torpedo_position)
-                quadrant = self.galaxy.quadrants[self.galactic_coordinates]
-                quadrant.klingons -= 1
-                break
-            elif torpedo_position in self.local_map.stars:
+            case TorpedoAbsorbed(sector=(x, y)):
                 print(f'STAR AT {x}, {y} ABSORBED TORPEDO ENERGY.')
-                break
-            elif torpedo_position in self.local_map.starbases:
+            case StarbaseDestroyed(relieved=relieved):
                 print('*** STARBASE DESTROYED ***')
-                self.local_map.starbases.remove(torpedo_position)
-                quadrant = self.galaxy.quadrants[self.galactic_coordinates]
-                quadrant.has_starbase = False
-                if self.galaxy.klingon_count > self.galaxy.time_remaining:
+                if relieved:
                     print((
                         'THAT DOES IT, CAPTAIN!!  YOU ARE HEREBY RELIEVED '
                         'OF COMMAND'
@@ -620,154 +396,131 @@ class Enterprise:
                         'AND SENTENCED TO 99 STARDATES AT HARD LABOR ON '
                         'CYGNUS 12!!'
                     ))
-                    self.fired = True
-                    return
                 else:
                     print(
                         'STARFLEET COMMAND REVIEWING YOUR RECORD TO CONSIDER',
                     )
                     print('COURT MARTIAL!')
-                break
-        self._process_klingon_firing()
-
-    def _adjust_shields(self, device_operational: bool):
-        if not device_operational:
-            print('SHIELD CONTROL INOPERABLE')
-            return
-        total_energy = self.energy + self.shields
-        info = f'ENERGY AVAILABLE = {total_energy}'
-        value = input(info + ' NUMBER OF UNITS TO SHIELDS: ')
-        if not value.isdigit():
-            print("SHIELD CONTROL REPORTS  'ORDER NOT UNDERSTOOD.'")
-            print('<SHIELDS UNCHANGED>')
-            return
-        value = int(value)
-        if value > total_energy:
-            print((
-                "SHIELD CONTROL REPORTS  'THIS IS NOT THE FEDERATION "
-                "TREASURY.'"
-            ))
-            print('<SHIELDS UNCHANGED>')
-        elif value == self.shields:
-            print('<SHIELDS UNCHANGED>')
-        else:
-            self.shields = value
-            self.energy = total_energy - self.shields
-            print('DEFLECTOR CONTROL ROOM REPORT:')
-            print((
-                f'SHIELDS NOW AT {self.shields} UNIT'
-                f'{'S' if self.shields != 1 else ''} PER YOUR COMMAND.'
-            ))
-
-    def _report_device_status(self):
-        print()
-        print('DEVICE             STATE OF REPAIR')
-        for device in self._devices.values():
-            print(f'{device.name:<19}{device.health:>15.2f}')
-        print()
-
-    def _damage_control(self, device_operational: bool):
-        if not device_operational:
-            print('DAMAGE CONTROL REPORT NOT AVAILABLE')
-        else:
-            self._report_device_status()
-        if not self.docked:
-            return
-        repair_cost = self.local_map.repair_factor * sum([
-            0.1 if not device.operational else 0.0
-            for device in self._devices.values()
-        ])
-        if repair_cost == 0.0:
-            return
-        print()
-        print('TECHNICIANS STANDING BY TO EFFECT REPAIRS TO YOUR SHIP;')
-        print(f'ESTIMATED TIME TO REPAIR: {repair_cost:.2f} STARDATES')
-        value = input('WILL YOU AUTHORIZE THE REPAIR ORDER? (Y/N) ')
-        if value.strip().upper() != 'Y':
-            return
-        for device in self._devices.values():
-            device.health = max(device.health, 0.0)
-        self._report_device_status()
-
-    def _use_library_computer(self, device_operational: bool):
-        if not device_operational:
-            print('COMPUTER DISABLED')
-            return
-        value = ''
-        first_iteration = True
-        while not value.isdigit() or not 0 <= int(value) <= 6:
-            if not first_iteration:
-                print('FUNCTIONS AVAILABLE FROM LIBRARY-COMPUTER:')
-                print('   0 = CUMULATIVE GALACTIC RECORD')
-                print('   1 = STATUS REPORT')
-                print('   2 = PHOTON TORPEDO DATA')
-                print('   3 = STARBASE NAV DATA')
-                print('   4 = DIRECTION/DISTANCE CALCULATOR')
-                print("   5 = GALAXY 'REGION NAME' MAP")
-                print('   6 = CANCEL')
+            case ShieldsUnchanged(excessive=excessive):
+                if excessive:
+                    print((
+                        "SHIELD CONTROL REPORTS  'THIS IS NOT THE FEDERATION "
+                        "TREASURY.'"
+                    ))
+                print('<SHIELDS UNCHANGED>')
+            case ShieldsAdjusted(shields=shields):
+                print('DEFLECTOR CONTROL ROOM REPORT:')
+                print((
+                    f'SHIELDS NOW AT {shields} UNIT{_plural(shields)} PER '
+                    f'YOUR COMMAND.'
+                ))
+            case RepairAuthorizationRequested(repair_time=repair_time):
+                print()
+                print('TECHNICIANS STANDING BY TO EFFECT REPAIRS TO YOUR SHIP;')
+                print(f'ESTIMATED TIME TO REPAIR: {repair_time:.2f} STARDATES')
+            case GalacticRecord():
+                self._render_galactic_record(event)
+            case StatusReport():
+                self._render_status_report(event)
+            case NavigationData():
+                print(f'    DIRECTION = {event.direction}')
+                print(f'    DISTANCE = {event.distance:.2f}')
+            case TorpedoData(targets=targets):
+                self._render_torpedo_data(targets)
+            case StarbaseNavData(target=target):
+                if target is None:
+                    print((
+                        "MR. SPOCK REPORTS,  'SENSORS SHOW NO STARBASES IN "
+                        "THIS QUADRANT.'"
+                    ))
+                    return
+                print('SENSORS DETECT LOCAL STARBASE:')
+                self._render_event(target)
+                print()
+            case CoordinatesRequested(quadrant=(q1, q2), sector=(s1, s2)):
+                print('DIRECTION/DISTANCE CALCULATOR:')
+                print(f'YOU ARE AT QUADRANT {q1}, {q2} SECTOR {s1}, {s2}')
+                print('PLEASE ENTER')
+            case GalaxyMap(regions=regions):
+                columns = len(regions)
+                print('                        THE GALAXY')
+                _print_grid_header(columns)
+                for i, row in enumerate(regions):
+                    names = ' '.join(name.center(23) for name in row)
+                    print(f'{i + 1:>2}   {names}')
+                    print(_grid_separator(columns))
                 print()
-            first_iteration = False
-            value = input('COMPUTER ACTIVE AND AWAITING COMMAND: ').strip()
-        match int(value):
-            case 0:
-                self._library_computer_galactic_record()
-            case 1:
-                self._library_computer_status_report()
-            case 2:
-                self._library_computer_torpedo_nav_data()
-            case 3:
-                self._library_computer_starbase_nav_data()
-            case 4:
-                self._library_computer_direction_distance_calculator()
-            case 5:
-                self._library_computer_galaxy_map()
             case _:
                 pass
 
-    def _library_computer_galactic_record(self):
-        x, y = self.galactic_coordinates
+    def _render_quadrant_entered(self, event: QuadrantEntered):
+        if event.mission_start:
+            print('YOUR MISSION BEGINS WITH YOUR STARSHIP LOCATED')
+            print(f'IN THE GALACTIC QUADRANT {event.name}')
+        else:
+            print(f'NOW ENTERING {event.name} QUADRANT . . .')
+        print()
+        if event.klingons > 0:
+            print('COMBAT AREA      CONDITION RED'.center(30))
+            if event.shields_low:
+                print('SHIELDS DANGEROUSLY LOW'.center(30))
+
+    def _render_short_range_scan(self, event: ShortRangeScanned):
+        g1, g2 = event.quadrant
+        s1, s2 = event.sector
+        size = event.size
+        status = [
+            f'STARDATE           {event.stardate}',
+            f'CONDITION          {event.condition}',
+            f'QUADRANT           {g1}, {g2}',
+            f'SECTOR             {s1}, {s2}',
+            f'PHOTON TORPEDOES   {event.torpedoes}',
+            f'TOTAL ENERGY       {event.total_energy}',
+            f'SHIELDS            {event.shields}',
+            f'KLINGONS REMAINING {event.klingons_remaining}',
+        ]
+        # The status column may run beyond the foot of a small grid:
+        lines = list(event.rows)
+        lines += ['    ' * size] * (len(status) - size)
+        for i, text in enumerate(status):
+            lines[i] += f'        {text}'
+        print('-' * (size * 4 + 1))
+        print('\n'.join(lines))
+        print('-' * (size * 4 + 1))
+
+    def _render_galactic_record(self, event: GalacticRecord):
+        x, y = event.quadrant
         print(f'        COMPUTER RECORD OF GALAXY FOR QUADRANT {x}, {y}')
         print()
-        print('       1     2     3     4     5     6     7     8')
-        print('     ----- ----- ----- ----- ----- ----- ----- -----')
-        for i in range(8):
-            line = f' {i + 1} '
-            for j in range(8):
+        columns = len(event.rows)
+        _print_grid_header(columns)
+        for i, row in enumerate(event.rows):
+            line = f'{i + 1:>2} '
+            for cell in row:
                 line += '   '
-                quadrant = self.galaxy.quadrants[(i, j)]
-                if not quadrant.entered:
-                    line += '***'
-                else:
-                    line += f'{quadrant.klingons}'
-                    line += f'{1 if quadrant.has_starbase else 0}'
-                    line += f'{quadrant.stars}'
+                line += '***' if cell is None else ''.join(map(str, cell))
             print(line)
-            print('     ----- ----- ----- ----- ----- ----- ----- -----')
+            print(_grid_separator(columns))
         print()
 
-    def _library_computer_status_report(self):
-        klingons = self.galaxy.klingon_count
-        time_limit = ceil(self.galaxy.end_date - self.galaxy.current_date)
-        bases = self.galaxy.starbase_count
+    def _render_status_report(self, event: StatusReport):
         print('   STATUS REPORT:')
-        print(f'KLINGON{'S' if klingons != 1 else ''} LEFT:  {klingons}')
+        print(f'KLINGON{_plural(event.klingons)} LEFT:  {event.klingons}')
         print((
-            f'MISSION MUST BE COMPLETED IN {time_limit} '
-            f'STARDATE{'S' if time_limit != 1 else ''}'
+            f'MISSION MUST BE COMPLETED IN {event.time_remaining} '
+            f'STARDATE{_plural(event.time_remaining)}'
         ))
-        if bases > 0:
+        if event.starbases > 0:
             print((
-                f'THE FEDERATION IS MAINTAINING {bases} '
-                f'STARBASE{'S' if bases != 1 else ''} IN THE GALAXY'
+                f'THE FEDERATION IS MAINTAINING {event.starbases} '
+                f'STARBASE{_plural(event.starbases)} IN THE GALAXY'
             ))
         else:
             print('YOUR STUPIDITY HAS LEFT YOU ON YOUR ON IN')
             print('  THE GALAXY -- YOU HAVE NO STARBASES LEFT!')
-        self._devices['DAM'].handle_command()
 
-    def _library_computer_torpedo_nav_data(self):
-        klingon_positions = list(self.local_map.klingons.keys())
-        match len(klingon_positions):
+    def _render_torpedo_data(self, targets: tuple[NavigationData, ...]):
+        match len(targets):
             case 0:
                 print((
                     "SCIENCE OFFICER SPOCK REPORTS  'SENSORS SHOW NO ENEMY "
@@ -778,55 +531,122 @@ class Enterprise:
                 print('SENSORS DETECT 1 ENEMY SHIP:')
                 print()
             case _:
-                print(f'SENSORS DETECT {len(klingon_positions)} ENEMY SHIPS:')
+                print(f'SENSORS DETECT {len(targets)} ENEMY SHIPS:')
                 print()
-        for position in klingon_positions:
-            _navigation_calculator(self.quadrant_coordinates, position)
+        for target in targets:
+            self._render_event(target)
             print()
 
-    def _library_computer_starbase_nav_data(self):
-        if not self.local_map.starbases:
-            print((
-                "MR. SPOCK REPORTS,  'SENSORS SHOW NO STARBASES IN THIS "
-                "QUADRANT.'"
-            ))
-            return
-        print('SENSORS DETECT LOCAL STARBASE:')
-        for position in self.local_map.starbases:
-            _navigation_calculator(self.quadrant_coordinates, position)
-            break
-        print()
 
-    def _library_computer_direction_distance_calculator(self):
-        pattern = r'^.*?([+-]?\d+).*,.*?([+-]?\d+).*$'
-        print('DIRECTION/DISTANCE CALCULATOR:')
-        q1, q2 = self.galactic_coordinates
-        s1, s2 = self.quadrant_coordinates
-        print(f'YOU ARE AT QUADRANT {q1}, {q2} SECTOR {s1}, {s2}')
-        print('PLEASE ENTER')
-        start_match = re.match(pattern, input('  INITIAL COORDINATES (X, Y) '))
-        if not start_match:
-            print('INVALID INPUT')
-            return
-        end_match = re.match(pattern, input('  FINAL COORDINATES (X, Y) '))
-        if not end_match:
-            print('INVALID INPUT')
-            return
-        start = tuple([int(x) for x in start_match.group(1, 2)])
-        end = tuple([int(x) for x in end_match.group(1, 2)])
-        print(start, end)
-        _navigation_calculator(start, end)
-
-    def _library_computer_galaxy_map(self):
-        x, y = self.galactic_coordinates
-        print('                        THE GALAXY')
-        print('       1     2     3     4     5     6     7     8')
-        print('     ----- ----- ----- ----- ----- ----- ----- -----')
-        for i in range(8):
-            lhs, rhs = (
-                self.galaxy.quadrants[(i, 0)].name[:-2],
-                self.galaxy.quadrants[(i, 4)].name[:-2],
-            )
-            print(f' {i + 1}   {lhs.center(23)} {rhs.center(23)}')
-            print('     ----- ----- ----- ----- ----- ----- ----- -----')
+_TITLE = '\n'.join([
+    *['' for _ in range(11)],
+    "                                    ,------*------,",
+    "                    ,-------------   '---  ------'",
+    "                     '-------- --'      / /",
+    "                         ,---' '-------/ /--,",
+    "                          '----------------'",
+    "",
+    "                    THE USS ENTERPRISE --- NCC-1701",
+    *['' for _ in range(5)],
+])
+
+
+def print_briefing(galaxy: Galaxy):
+    """Prints the title and the player's orders."""
+    print(_TITLE)
+    duration = galaxy.end_date - galaxy.start_date
+    orders_warship_text = (
+        f'THE {galaxy.initial_klingon_count} KLINGON '
+        f'WARSHIP{'S' if galaxy.initial_klingon_count != 1 else ''}'
+    )
+    orders_starbase_text = (
+        f'{'ARE' if galaxy.initial_starbase_count != 1 else 'IS'} '
+        f'{galaxy.initial_starbase_count} '
+        f'STARBASE{'S' if galaxy.initial_starbase_count != 1 else ''}'
+    )
+    orders_components = [
+        f'DESTROY {orders_warship_text} WHICH HAVE INVADED',
+        'THE GALAXY BEFORE THEY CAN ATTACK FEDERATION HEADQUARTERS',
+        (
+            f'ON STARDATE {galaxy.end_date}. THIS GIVES YOU {duration} '
+            'DAYS. THERE'
+        ),
+        f'{orders_starbase_text} IN THE GALAXY FOR RESUPPLYING YOUR SHIP.',
+    ]
+    print('YOUR ORDERS ARE AS FOLLOWS:')
+    print('\n'.join(['    ' + x.center(57) for x in orders_components]))
+    print()
+
+
+def _print_klingons_left(count: int):
+    print((
+        f'THERE {'WERE' if count != 1 else 'WAS'} '
+        f'{count} KLINGON WARSHIP'
+        f'{'S' if count != 1 else ''} LEFT AT'
+    ))
+    print('THE END OF YOUR MISSION.')
+
+
+def print_mission_end(enterprise: Enterprise):
+    """Prints the outcome of a finished mission."""
+    galaxy = enterprise.galaxy
+    final_klingon_count = galaxy.klingon_count
+    if enterprise.resigned:
+        _print_klingons_left(final_klingon_count)
+    elif enterprise.destroyed:
+        print((
+            '\nTHE ENTERPRISE HAS BEEN DESTROYED.  THE FEDERATION '
+            'WILL BE CONQUERED'
+        ))
+        print(f'IT IS STARDATE {floor(galaxy.current_date)}')
+        _print_klingons_left(final_klingon_count)
+    elif galaxy.current_date >= galaxy.end_date and final_klingon_count > 0:
+        print((
+            f'IT IS STARDATE {floor(galaxy.current_date)}.  '
+            'YOU ARE OUT OF TIME!'
+        ))
+        _print_klingons_left(final_klingon_count)
+    else:
+        efficiency = galaxy.initial_klingon_count
+        efficiency /= galaxy.current_date - galaxy.start_date
+        efficiency = 1000.0 * pow(efficiency, 2)
+        print('CONGRULATIONS, CAPTAIN!  THE LAST KLINGON BATTLE CRUISER')
+        print('MENACING THE FDERATION HAS BEEN DESTROYED.')
         print()
+        print(f'YOUR EFFICIENCY RATING IS {efficiency:.2f}')
+
+
+def command_loop(enterprise: Enterprise) -> Dialogue[None]:
+    """Requests and carries out commands until the mission is over."""
+    galaxy = enterprise.galaxy
+    while not enterprise.destroyed and not enterprise.resigned:
+        command = yield 'ENTER A COMMAND: '
+        yield from enterprise.handle_command(command.upper().strip())
+        if galaxy.current_date >= galaxy.end_date:
+            break
+        elif galaxy.klingon_count == 0 or enterprise.fired:
+            break
+
+
+def play_mission(
+        galaxy: Galaxy | None = None,
+        record: bool = False,
+) -> Dialogue[Enterprise]:
+    """Plays a whole mission, from the title to the final report."""
+    if galaxy is None:
+        galaxy = Galaxy()
+    print_briefing(galaxy)
+    enterprise = Enterprise(galaxy, record)
+    yield from command_loop(enterprise)
+    print_mission_end(enterprise)
+    return enterprise
+
+
+def answer_with_input[T](dialogue: Dialogue[T]) -> T:
+    """Runs a dialogue in the terminal, answering prompts with input()."""
+    try:
+        prompt = next(dialogue)
+        while True:
+            prompt = dialogue.send(input(prompt))
+    except StopIteration as stop:
+        return stop.value